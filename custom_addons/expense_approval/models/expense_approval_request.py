@@ -1,8 +1,15 @@
 # Copyright 2025 InsightPulseAI
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0)
 
-from odoo import models, fields, api
-from odoo.exceptions import ValidationError
+from odoo import models, fields, api, tools
+
+STATE_SELECTION = [
+    ("draft", "Draft"),
+    ("submitted", "Submitted"),
+    ("approved", "Approved"),
+    ("rejected", "Rejected"),
+]
+STATE_LABELS = dict(STATE_SELECTION)
 
 
 class ExpenseApprovalRequest(models.Model):
@@ -26,12 +33,14 @@ class ExpenseApprovalRequest(models.Model):
         "res.company",
         string="Company",
         default=lambda self: self.env.company,
+        index="btree_not_null",
     )
     user_id = fields.Many2one(
         "res.users",
         string="User",
         default=lambda self: self.env.user,
         required=True,
+        index="btree_not_null",
     )
     amount = fields.Float(
         string="Amount",
@@ -39,12 +48,7 @@ class ExpenseApprovalRequest(models.Model):
         default=0.0,
     )
     state = fields.Selection(
-        [
-            ("draft", "Draft"),
-            ("submitted", "Submitted"),
-            ("approved", "Approved"),
-            ("rejected", "Rejected"),
-        ],
+        STATE_SELECTION,
         string="Status",
         default="draft",
         required=True,
@@ -55,43 +59,45 @@ class ExpenseApprovalRequest(models.Model):
     display_name_custom = fields.Char(
         string="Display Name",
         compute="_compute_display_name_custom",
-        store=True,
     )
 
+    def init(self):
+        """Index the default ordering within a company"""
+        tools.create_index(
+            self._cr,
+            "expense_approval_request_company_create_date_index",
+            self._table,
+            ["company_id", "create_date DESC"],
+        )
+
     @api.depends("name", "state")
     def _compute_display_name_custom(self):
         """Compute custom display name with status"""
         for record in self:
-            state_label = dict(
-                record._fields["state"].selection
-            ).get(record.state, "")
+            state_label = STATE_LABELS.get(record.state, "")
             record.display_name_custom = f"{record.name} [{state_label}]"
 
     # Constraints
-    @api.constrains("name")
-    def _check_name_not_empty(self):
-        """Ensure name is not empty or whitespace only"""
-        for record in self:
-            if not record.name or not record.name.strip():
-                raise ValidationError("Name cannot be empty")
+    _sql_constraints = [
+        ("name_not_empty", "CHECK (btrim(name) <> '')", "Name cannot be empty"),
+    ]
 
     # Actions
+    # Work on whole recordsets so list-view multi-selection is
+    # transitioned with a single UPDATE; records already in the target
+    # state are skipped to avoid a needless recompute.
     def action_submit(self):
         """Submit for approval"""
-        self.ensure_one()
-        self.write({"state": "submitted"})
+        self.filtered(lambda r: r.state != "submitted").write({"state": "submitted"})
 
     def action_approve(self):
         """Approve request"""
-        self.ensure_one()
-        self.write({"state": "approved"})
+        self.filtered(lambda r: r.state != "approved").write({"state": "approved"})
 
     def action_reject(self):
         """Reject request"""
-        self.ensure_one()
-        self.write({"state": "rejected"})
+        self.filtered(lambda r: r.state != "rejected").write({"state": "rejected"})
 
     def action_reset_to_draft(self):
         """Reset to draft"""
-        self.ensure_one()
-        self.write({"state": "draft"})
+        self.filtered(lambda r: r.state != "draft").write({"state": "draft"})
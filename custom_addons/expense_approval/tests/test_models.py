@@ -1,8 +1,10 @@
 # Copyright 2025 InsightPulseAI
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0)
 
+from psycopg2 import IntegrityError
+
 from odoo.tests.common import TransactionCase
-from odoo.exceptions import ValidationError
+from odoo.tools import mute_logger
 
 
 class TestModels(TransactionCase):
@@ -14,6 +16,11 @@ class TestModels(TransactionCase):
 
         self.ExpenseApprovalRequestModel = self.env["expense.approval.request"]
 
+        # Shared fixtures, created with a single multi-row create
+        self.records = self.ExpenseApprovalRequestModel.create([
+            {"name": f"Test Request {i}", "user_id": self.user.id}
+            for i in range(5)
+        ])
 
     def test_create_expense_approval_request(self):
         """Test creating expense.approval.request record"""
@@ -27,10 +34,7 @@ class TestModels(TransactionCase):
 
     def test_expense_approval_request_workflow(self):
         """Test expense.approval.request state workflow"""
-        record = self.ExpenseApprovalRequestModel.create({
-            "name": "Test Workflow",
-            "user_id": self.user.id,
-        })
+        record = self.records[0]
 
         # Test submit
         record.action_submit()
@@ -44,19 +48,34 @@ class TestModels(TransactionCase):
         record.action_reset_to_draft()
         self.assertEqual(record.state, "draft")
 
+    @mute_logger("odoo.sql_db")
     def test_expense_approval_request_name_constraint(self):
         """Test name cannot be empty"""
-        with self.assertRaises(ValidationError):
+        with self.assertRaises(IntegrityError):
             self.ExpenseApprovalRequestModel.create({
                 "name": "   ",  # Empty/whitespace
                 "user_id": self.user.id,
             })
+            self.env.flush_all()
 
     def test_expense_approval_request_computed_fields(self):
         """Test computed field: display_name_custom"""
-        record = self.ExpenseApprovalRequestModel.create({
-            "name": "Test Compute",
-            "user_id": self.user.id,
-        })
-        self.assertIn("Test Compute", record.display_name_custom)
+        record = self.records[0]
+        self.assertIn("Test Request 0", record.display_name_custom)
         self.assertIn("[Draft]", record.display_name_custom)
+
+    def test_bulk_workflow(self):
+        """Test state actions apply to a whole recordset at once"""
+        self.records.action_submit()
+        self.assertEqual(set(self.records.mapped("state")), {"submitted"})
+
+        self.records[:2].action_approve()
+        self.records.action_approve()
+        self.assertEqual(set(self.records.mapped("state")), {"approved"})
+        self.assertTrue(all(
+            "[Approved]" in name
+            for name in self.records.mapped("display_name_custom")
+        ))
+
+        self.records.action_reset_to_draft()
+        self.assertEqual(set(self.records.mapped("state")), {"draft"})
@@ -3,6 +3,7 @@
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
 import base64
+import functools
 import hashlib
 import hmac
 import json
@@ -13,8 +14,41 @@ import requests
 from odoo import api, fields, models, _
 from odoo.exceptions import UserError, ValidationError
 
+from ..utils import github_post
+
 _logger = logging.getLogger(__name__)
 
+_DISPATCH_PARAMS = (
+    'pulser.webhook.secret',
+    'pulser.github.token',
+    'pulser.github.repo',
+)
+_GITHUB_DISPATCH_URL = 'https://api.github.com/repos/%s/dispatches'
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_secret(secret):
+    """Return the raw HMAC key bytes for a base64-encoded secret"""
+    return base64.b64decode(secret)
+
+
+def _sign(key, body, algo='sha256'):
+    """Return the X-Pulser-Signature header value for a request body
+
+    Args:
+        key (bytes): Raw secret key
+        body (bytes): Exact request body
+        algo (str): 'sha256' (HMAC-SHA256, default) or 'blake2b'
+            (keyed BLAKE2b, cheaper single-pass MAC; the receiving
+            workflow must verify the same algorithm)
+
+    Returns:
+        str: '<algo>=<hexdigest>'
+    """
+    if algo == 'blake2b':
+        return 'blake2b=' + hashlib.blake2b(body, key=key, digest_size=32).hexdigest()
+    return 'sha256=' + hmac.digest(key, body, 'sha256').hex()
+
 
 class PulserGitopsWizard(models.TransientModel):
     """Git-Ops Dispatch Wizard
@@ -52,12 +86,36 @@ class PulserGitopsWizard(models.TransientModel):
         help='GitHub API response details',
     )
 
+    def _get_dispatch_params(self):
+        """Read and validate the dispatch system parameters
+
+        ``get_param`` is served from the registry ormcache, so only the
+        first dispatch after a parameter change reaches the database.
+
+        Returns:
+            tuple: (secret, github_token, repo, signature_algo)
+        """
+        IrConfigParameter = self.env['ir.config_parameter'].sudo()
+        values = []
+        for key in _DISPATCH_PARAMS:
+            value = IrConfigParameter.get_param(key)
+            if not value:
+                raise ValidationError(_(
+                    'Missing %s in System Parameters.\n'
+                    'Configure in Settings > Technical > Parameters > System Parameters'
+                ) % key)
+            values.append(value)
+        values.append(IrConfigParameter.get_param(
+            'pulser.webhook.signature_algo', 'sha256'
+        ))
+        return tuple(values)
+
     def action_dispatch(self):
         """Send repository_dispatch to GitHub API with HMAC signature
 
         Workflow:
         1. Build payload with event_type and client_payload
-        2. Generate HMAC-SHA256 signature from secret
+        2. Generate HMAC-SHA256 (or BLAKE2b) signature from secret
         3. Send POST to GitHub API with signature header
         4. Handle response and display notification
 
@@ -82,39 +140,14 @@ class PulserGitopsWizard(models.TransientModel):
             }
 
         # Get configuration from system parameters
-        IrConfigParameter = self.env['ir.config_parameter'].sudo()
-
-        secret = IrConfigParameter.get_param('pulser.webhook.secret')
-        if not secret:
-            raise ValidationError(_(
-                'Missing pulser.webhook.secret in System Parameters.\n'
-                'Configure in Settings > Technical > Parameters > System Parameters'
-            ))
-
-        github_token = IrConfigParameter.get_param('pulser.github.token')
-        if not github_token:
-            raise ValidationError(_(
-                'Missing pulser.github.token in System Parameters.\n'
-                'Configure in Settings > Technical > Parameters > System Parameters'
-            ))
-
-        repo = IrConfigParameter.get_param('pulser.github.repo')
-        if not repo:
-            raise ValidationError(_(
-                'Missing pulser.github.repo in System Parameters.\n'
-                'Configure in Settings > Technical > Parameters > System Parameters'
-            ))
+        secret, github_token, repo, algo = self._get_dispatch_params()
 
-        # Generate HMAC signature
+        # Generate HMAC signature over the exact bytes sent as the body
         try:
-            payload_str = json.dumps(payload, sort_keys=True)
-            signature = hmac.new(
-                base64.b64decode(secret),
-                payload_str.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
+            body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+            signature = _sign(_decode_secret(secret), body, algo)
         except Exception as e:
-            _logger.error('Failed to generate HMAC signature: %s', str(e))
+            _logger.error('Failed to generate HMAC signature: %s', e)
             raise ValidationError(_(
                 'Failed to generate HMAC signature.\n'
                 'Ensure pulser.webhook.secret is a valid base64-encoded string.\n'
@@ -122,21 +155,17 @@ class PulserGitopsWizard(models.TransientModel):
             ) % str(e))
 
         # GitHub API call
-        url = f'https://api.github.com/repos/{repo}/dispatches'
+        url = _GITHUB_DISPATCH_URL % repo
         headers = {
             'Authorization': f'Bearer {github_token}',
             'Accept': 'application/vnd.github+json',
             'X-GitHub-Api-Version': '2022-11-28',
-            'X-Pulser-Signature': f'sha256={signature}',
+            'Content-Type': 'application/json',
+            'X-Pulser-Signature': signature,
         }
 
         try:
-            response = requests.post(
-                url,
-                json=payload,
-                headers=headers,
-                timeout=10
-            )
+            response = github_post(url, headers, body)
 
             # Store response
             response_data = {
@@ -192,7 +221,7 @@ class PulserGitopsWizard(models.TransientModel):
                 'Error: %s'
             ) % str(e))
         except requests.exceptions.RequestException as e:
-            _logger.error('GitHub API request failed: %s', str(e))
+            _logger.error('GitHub API request failed: %s', e)
             raise UserError(_(
                 'GitHub API request failed.\n'
                 'Error: %s'
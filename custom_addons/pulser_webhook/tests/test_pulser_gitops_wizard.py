@@ -11,28 +11,43 @@ from unittest.mock import patch, MagicMock
 from odoo.tests.common import TransactionCase
 from odoo.exceptions import ValidationError
 
+SESSION_POST = 'odoo.addons.pulser_webhook.utils._SESSION.post'
+
 
 class TestPulserGitopsWizard(TransactionCase):
     """Test Pulser Git-Ops Wizard functionality"""
 
-    def setUp(self):
-        super().setUp()
-        self.wizard_model = self.env['pulser.gitops.wizard']
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.wizard_model = cls.env['pulser.gitops.wizard']
+        cls.icp = cls.env['ir.config_parameter'].sudo()
 
-        # Setup config parameters
-        self.env['ir.config_parameter'].sudo().set_param(
+        # Setup config parameters once; each test runs in a savepoint,
+        # so tests that blank a parameter are rolled back afterwards
+        cls.icp.set_param(
             'pulser.webhook.secret',
             base64.b64encode(b'test-secret-key').decode('utf-8')
         )
-        self.env['ir.config_parameter'].sudo().set_param(
+        cls.icp.set_param(
             'pulser.github.token',
             'ghp_test_token_1234567890'
         )
-        self.env['ir.config_parameter'].sudo().set_param(
+        cls.icp.set_param(
             'pulser.github.repo',
             'test-org/test-repo'
         )
 
+        # Shared 204 No Content response for successful dispatch tests
+        cls._ok_response = MagicMock(
+            status_code=204,
+            headers={'X-GitHub-Request-Id': 'test-id-123'},
+        )
+
+    def setUp(self):
+        super().setUp()
+        self._ok_response.reset_mock()
+
     def test_wizard_creation(self):
         """Test wizard can be created with default values"""
         wizard = self.wizard_model.create({
@@ -45,14 +60,16 @@ class TestPulserGitopsWizard(TransactionCase):
         self.assertFalse(wizard.kv_key)
         self.assertFalse(wizard.response_json)
 
-    def test_hmac_signature_generation(self):
+    @patch(SESSION_POST)
+    def test_hmac_signature_generation(self, mock_post):
         """Test HMAC signature is correctly generated"""
+        mock_post.return_value = self._ok_response
         wizard = self.wizard_model.create({
             'branch': 'main',
             'message': 'Deploy to production',
         })
 
-        secret = self.env['ir.config_parameter'].sudo().get_param(
+        secret = self.icp.get_param(
             'pulser.webhook.secret'
         )
 
@@ -64,25 +81,31 @@ class TestPulserGitopsWizard(TransactionCase):
             }
         }
 
-        payload_str = json.dumps(payload, sort_keys=True)
-        expected_signature = hmac.new(
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        expected_signature = hmac.digest(
             base64.b64decode(secret),
-            payload_str.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+            body,
+            'sha256'
+        ).hex()
 
         # Verify signature format
         self.assertTrue(isinstance(expected_signature, str))
         self.assertEqual(len(expected_signature), 64)  # SHA256 hex length
 
-    @patch('requests.post')
+        # Body is compact, insertion-ordered JSON and the header signs it
+        wizard.action_dispatch()
+        call_kwargs = mock_post.call_args[1]
+        self.assertEqual(call_kwargs['data'], body)
+        self.assertEqual(
+            call_kwargs['headers']['X-Pulser-Signature'],
+            'sha256=%s' % expected_signature
+        )
+
+    @patch(SESSION_POST)
     def test_action_dispatch_success(self, mock_post):
         """Test successful GitHub API dispatch"""
         # Mock successful response (204 No Content)
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_response.headers = {'X-GitHub-Request-Id': 'test-id-123'}
-        mock_post.return_value = mock_response
+        mock_post.return_value = self._ok_response
 
         wizard = self.wizard_model.create({
             'branch': 'staging',
@@ -108,20 +131,45 @@ class TestPulserGitopsWizard(TransactionCase):
         self.assertIn('Bearer ghp_test_token', headers['Authorization'])
         self.assertIn('X-Pulser-Signature', headers)
         self.assertTrue(headers['X-Pulser-Signature'].startswith('sha256='))
+        self.assertEqual(headers['Content-Type'], 'application/json')
 
-        # Check payload
-        payload = call_args[1]['json']
+        # Check payload is sent as the signed bytes
+        payload = json.loads(call_args[1]['data'])
         self.assertEqual(payload['event_type'], 'deploy_request')
         self.assertEqual(payload['client_payload']['branch'], 'staging')
         self.assertEqual(payload['client_payload']['message'], 'Test deployment')
 
-    @patch('requests.post')
+    @patch(SESSION_POST)
+    def test_action_dispatch_blake2b_signature(self, mock_post):
+        """Test optional BLAKE2b signature over the sent body"""
+        mock_post.return_value = self._ok_response
+
+        self.icp.set_param(
+            'pulser.webhook.signature_algo',
+            'blake2b'
+        )
+        wizard = self.wizard_model.create({
+            'branch': 'main',
+            'message': 'Deploy with blake2b',
+        })
+
+        wizard.action_dispatch()
+
+        call_kwargs = mock_post.call_args[1]
+        expected_signature = hashlib.blake2b(
+            call_kwargs['data'],
+            key=b'test-secret-key',
+            digest_size=32,
+        ).hexdigest()
+        self.assertEqual(
+            call_kwargs['headers']['X-Pulser-Signature'],
+            'blake2b=%s' % expected_signature
+        )
+
+    @patch(SESSION_POST)
     def test_action_dispatch_with_kv(self, mock_post):
         """Test dispatch with optional KV parameters"""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_response.headers = {}
-        mock_post.return_value = mock_response
+        mock_post.return_value = self._ok_response
 
         wizard = self.wizard_model.create({
             'branch': 'production',
@@ -133,11 +181,11 @@ class TestPulserGitopsWizard(TransactionCase):
         wizard.action_dispatch()
 
         # Verify KV pair in payload
-        payload = mock_post.call_args[1]['json']
+        payload = json.loads(mock_post.call_args[1]['data'])
         self.assertIn('kv', payload['client_payload'])
         self.assertEqual(payload['client_payload']['kv']['ENVIRONMENT'], 'production')
 
-    @patch('requests.post')
+    @patch(SESSION_POST)
     def test_action_dispatch_api_error(self, mock_post):
         """Test handling of GitHub API errors"""
         # Mock error response
@@ -162,7 +210,7 @@ class TestPulserGitopsWizard(TransactionCase):
     def test_missing_secret_validation(self):
         """Test validation when secret is missing"""
         # Remove secret
-        self.env['ir.config_parameter'].sudo().set_param(
+        self.icp.set_param(
             'pulser.webhook.secret',
             ''
         )
@@ -180,7 +228,7 @@ class TestPulserGitopsWizard(TransactionCase):
     def test_missing_token_validation(self):
         """Test validation when GitHub token is missing"""
         # Remove token
-        self.env['ir.config_parameter'].sudo().set_param(
+        self.icp.set_param(
             'pulser.github.token',
             ''
         )
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Shared per worker process so consecutive Git-Ops calls reuse the
+# TCP/TLS connection to api.github.com instead of re-handshaking.
+# urllib3 only retries POST on connection failures, so a dispatch that
+# reached GitHub is never sent twice.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+    ),
+))
+
+# Separate (connect, read) budgets so a slow TLS handshake cannot eat
+# the whole timeout meant for GitHub to answer.
+DEFAULT_TIMEOUT = (3.05, 15)
+
+
+def github_post(url, headers, data, timeout=DEFAULT_TIMEOUT):
+    """POST to the GitHub API over the shared pooled session
+
+    Args:
+        url (str): GitHub API endpoint
+        headers (dict): Request headers
+        data (bytes): Request body, sent as-is
+        timeout (float|tuple): Requests timeout
+
+    Returns:
+        requests.Response: Raw API response
+    """
+    return _SESSION.post(url, data=data, headers=headers, timeout=timeout)
@@ -4,7 +4,7 @@
 
 {
     'name': 'QMS SOP',
-    'version': '16.0.1.0.0',
+    'version': '16.0.1.1.0',
     'summary': 'QMS Standard Operating Procedures with error tracking',
     'category': 'Quality Management',
     'author': 'Odoo Community Association (OCA)',
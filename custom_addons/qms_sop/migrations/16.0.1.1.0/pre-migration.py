@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+# UNIQUE(code) constraints replaced by partial unique indexes on active
+# records (created in qms.active.code.mixin's init())
+LEGACY_CONSTRAINTS = [
+    ('qms_error_code', 'qms_error_code_code_unique'),
+    ('qms_sop_document', 'qms_sop_document_code_unique'),
+]
+
+
+def migrate(cr, version):
+    """Drop the legacy code uniqueness constraints"""
+    if not version:
+        return
+    for table, constraint in LEGACY_CONSTRAINTS:
+        cr.execute(
+            'ALTER TABLE %s DROP CONSTRAINT IF EXISTS %s' % (table, constraint)
+        )
+    cr.execute(
+        "DELETE FROM ir_model_constraint WHERE name = ANY(%s) AND type = 'u'",
+        ([constraint for _table, constraint in LEGACY_CONSTRAINTS],),
+    )
@@ -2,6 +2,7 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+from . import qms_active_code_mixin
 from . import qms_sop_document
 from . import qms_sop_step
 from . import qms_error_code
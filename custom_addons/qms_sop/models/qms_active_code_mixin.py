@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# Copyright 2025 Odoo Community Association (OCA)
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import _lt, api, fields, models, tools
+from odoo.exceptions import ValidationError
+
+
+class QmsActiveCodeMixin(models.AbstractModel):
+    """Code unique among active records; archived codes can be reused"""
+
+    _name = 'qms.active.code.mixin'
+    _description = 'QMS Active Code Mixin'
+
+    # Error message for duplicate codes, formatted with the codes
+    _code_unique_message = _lt('Code must be unique: %s')
+
+    code = fields.Char(
+        string='Code',
+        required=True,
+        copy=False,
+    )
+    active = fields.Boolean(
+        string='Active',
+        default=True,
+    )
+
+    def init(self):
+        """Enforce unique codes among active records only
+
+        Archived records stay out of the index so their code can be reused.
+        """
+        index_name = '%s_code_active_uniq' % self._table
+        if not tools.index_exists(self._cr, index_name):
+            self._cr.execute(
+                'CREATE UNIQUE INDEX %s ON %s (code) WHERE active'
+                % (index_name, self._table)
+            )
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        # The INSERT hits the unique index before constraints run, so
+        # check new active codes first to report a readable error
+        self.flush_model(['code', 'active'])
+        self._check_duplicate_codes([
+            vals['code'] for vals in vals_list
+            if vals.get('code') and vals.get('active', True)
+        ])
+        return super().create(vals_list)
+
+    @api.constrains('code', 'active')
+    def _check_code_unique(self):
+        """Validate code is unique among active records"""
+        self._check_duplicate_codes(
+            [record.code for record in self if record.active], self.ids
+        )
+
+    def _check_duplicate_codes(self, codes, exclude_ids=()):
+        """Raise if codes repeat or are used by another active record
+
+        Queries the table directly: an ORM search would first flush the
+        pending values into the partial unique index, which then raises
+        an IntegrityError instead.
+        """
+        duplicates = {code for code in codes if codes.count(code) > 1}
+        if codes and not duplicates:
+            self._cr.execute(
+                'SELECT code FROM %s' % self._table
+                + ' WHERE active AND code = ANY(%s) AND id != ALL(%s)',
+                (codes, list(exclude_ids)),
+            )
+            duplicates = {code for code, in self._cr.fetchall()}
+        if duplicates:
+            raise ValidationError(
+                str(self._code_unique_message) % ', '.join(sorted(duplicates))
+            )
@@ -2,17 +2,19 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import api, fields, models, _
-from odoo.exceptions import ValidationError
+from odoo import _lt, fields, models
 
 
 class QmsErrorCode(models.Model):
     """QMS Error Code Registry"""
 
     _name = 'qms.error.code'
+    _inherit = 'qms.active.code.mixin'
     _description = 'QMS Error Code'
     _order = 'code'
 
+    _code_unique_message = _lt('Error code must be unique: %s')
+
     code = fields.Char(
         string='Code',
         required=True,
@@ -42,11 +44,3 @@ class QmsErrorCode(models.Model):
         ondelete='set null',
         help='Related SOP for error resolution',
     )
-    active = fields.Boolean(
-        string='Active',
-        default=True,
-    )
-
-    _sql_constraints = [
-        ('code_unique', 'UNIQUE(code)', 'Error code must be unique!'),
-    ]
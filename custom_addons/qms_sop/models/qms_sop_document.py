@@ -2,17 +2,19 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import api, fields, models, _
-from odoo.exceptions import ValidationError
+from odoo import _lt, fields, models
 
 
 class QmsSopDocument(models.Model):
     """QMS Standard Operating Procedure Document"""
 
     _name = 'qms.sop.document'
+    _inherit = 'qms.active.code.mixin'
     _description = 'QMS SOP Document'
     _order = 'code, name'
 
+    _code_unique_message = _lt('SOP code must be unique: %s')
+
     name = fields.Char(
         string='Name',
         required=True,
@@ -58,21 +60,11 @@ class QmsSopDocument(models.Model):
         string='Runs',
         help='Execution history of this SOP',
     )
-    active = fields.Boolean(
-        string='Active',
-        default=True,
-    )
 
     _sql_constraints = [
-        ('code_unique', 'UNIQUE(code)', 'SOP code must be unique!'),
+        (
+            'code_format',
+            "CHECK(code LIKE 'SOP-%')",
+            'SOP code must start with "SOP-" prefix (e.g. SOP-BUILD-001)!',
+        ),
     ]
-
-    @api.constrains('code')
-    def _check_code_format(self):
-        """Validate SOP code format"""
-        for record in self:
-            if not record.code.startswith('SOP-'):
-                raise ValidationError(_(
-                    'SOP code must start with "SOP-" prefix.\n'
-                    'Example: SOP-BUILD-001'
-                ))
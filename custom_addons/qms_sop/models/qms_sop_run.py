@@ -2,7 +2,7 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import api, fields, models
+from odoo import Command, api, fields, models, tools
 
 
 class QmsSopRun(models.Model):
@@ -61,42 +61,60 @@ class QmsSopRun(models.Model):
         string='End Date',
     )
 
-    @api.model
-    def create(self, vals):
-        """Auto-create step runs when SOP run is created"""
-        run = super().create(vals)
+    def init(self):
+        """Index the default _order so list views avoid a sort"""
+        tools.create_index(
+            self._cr,
+            'qms_sop_run_ordering_index',
+            self._table,
+            ['create_date DESC', 'id DESC'],
+        )
 
-        if run.sop_id and run.sop_id.step_ids:
-            StepRun = self.env['qms.sop.run.step']
-            for step in run.sop_id.step_ids:
-                StepRun.create({
-                    'run_id': run.id,
-                    'step_id': step.id,
-                    'state': 'pending',
-                })
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Auto-create step runs when SOP runs are created"""
+        sop_ids = {
+            vals['sop_id'] for vals in vals_list
+            if vals.get('sop_id') and 'step_run_ids' not in vals
+        }
+        if not sop_ids:
+            return super().create(vals_list)
 
-        return run
+        # Read the steps of all SOPs in one prefetch batch; SOPs without
+        # steps are left out so their runs get no empty commands
+        step_ids_by_sop = {
+            sop.id: sop.step_ids.ids
+            for sop in self.env['qms.sop.document'].browse(sop_ids)
+            if sop.step_ids
+        }
+        for i, vals in enumerate(vals_list):
+            if vals.get('sop_id') in step_ids_by_sop and 'step_run_ids' not in vals:
+                vals_list[i] = dict(vals, step_run_ids=[
+                    Command.create({'step_id': step_id, 'state': 'pending'})
+                    for step_id in step_ids_by_sop[vals['sop_id']]
+                ])
+        return super().create(vals_list)
 
     def action_start(self):
         """Start SOP execution"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'in_progress',
-            'start_date': fields.Datetime.now(),
+            'start_date': now,
         })
 
     def action_complete(self):
         """Mark SOP execution as completed"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'completed',
-            'end_date': fields.Datetime.now(),
+            'end_date': now,
         })
 
     def action_fail(self):
         """Mark SOP execution as failed"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'failed',
-            'end_date': fields.Datetime.now(),
+            'end_date': now,
         })
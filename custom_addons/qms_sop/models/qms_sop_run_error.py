@@ -2,7 +2,7 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 
 
 class QmsSopRunError(models.Model):
@@ -23,6 +23,7 @@ class QmsSopRunError(models.Model):
         comodel_name='qms.error.code',
         string='Error Code',
         help='Predefined error code',
+        index=True,
     )
     description = fields.Text(
         string='Description',
@@ -34,14 +35,21 @@ class QmsSopRunError(models.Model):
         default=fields.Datetime.now,
     )
 
-    # Related fields for convenience
+    # Related fields for convenience (joined on read, not duplicated)
     error_code = fields.Char(
         related='error_code_id.code',
         string='Code',
-        store=True,
     )
     error_severity = fields.Selection(
         related='error_code_id.severity',
         string='Severity',
-        store=True,
     )
+
+    def init(self):
+        """Index the default _order so list views avoid a sort"""
+        tools.create_index(
+            self._cr,
+            'qms_sop_run_error_ordering_index',
+            self._table,
+            ['create_date DESC'],
+        )
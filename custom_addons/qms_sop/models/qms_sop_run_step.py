@@ -2,7 +2,7 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import api, fields, models
+from odoo import api, fields, models, tools
 
 
 class QmsSopRunStep(models.Model):
@@ -25,6 +25,7 @@ class QmsSopRunStep(models.Model):
         required=True,
         ondelete='restrict',
         help='SOP step being executed',
+        index=True,
     )
     state = fields.Selection(
         selection=[
@@ -50,46 +51,53 @@ class QmsSopRunStep(models.Model):
         string='Completed At',
     )
 
-    # Related fields for convenience
+    # Related fields for convenience (joined on read, not duplicated)
     step_sequence = fields.Integer(
         related='step_id.sequence',
         string='Sequence',
-        store=True,
     )
     step_title = fields.Char(
         related='step_id.title',
         string='Title',
-        store=True,
     )
 
+    def init(self):
+        """Index the default _order so list views avoid a sort"""
+        tools.create_index(
+            self._cr,
+            'qms_sop_run_step_ordering_index',
+            self._table,
+            ['run_id', 'step_id'],
+        )
+
     def action_start(self):
         """Mark step as in progress"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'in_progress',
-            'started_at': fields.Datetime.now(),
+            'started_at': now,
         })
 
     def action_complete(self):
         """Mark step as completed"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'completed',
-            'completed_at': fields.Datetime.now(),
+            'completed_at': now,
         })
 
     def action_fail(self):
         """Mark step as failed"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'failed',
-            'completed_at': fields.Datetime.now(),
+            'completed_at': now,
         })
 
     def action_skip(self):
         """Mark step as skipped"""
-        self.ensure_one()
+        now = fields.Datetime.now()
         self.write({
             'state': 'skipped',
-            'completed_at': fields.Datetime.now(),
+            'completed_at': now,
         })
@@ -2,6 +2,7 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+from odoo.exceptions import ValidationError
 from odoo.tests.common import TransactionCase
 
 
@@ -34,13 +35,33 @@ class TestQmsErrorCode(TransactionCase):
             'severity': 'low',
         })
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(ValidationError):
             self.ErrorCode.create({
                 'code': 'DUP_ERROR',
                 'title': 'Second Error',
                 'severity': 'high',
             })
 
+    def test_error_code_reuse_archived_code(self):
+        """Test an archived error code does not block reusing its code"""
+        archived = self.ErrorCode.create({
+            'code': 'REUSED_ERROR',
+            'title': 'Old Error',
+            'severity': 'low',
+        })
+        archived.active = False
+        archived.flush_recordset()
+
+        error = self.ErrorCode.create({
+            'code': 'REUSED_ERROR',
+            'title': 'New Error',
+            'severity': 'high',
+        })
+        self.env.flush_all()
+
+        self.assertTrue(error.active)
+        self.assertFalse(archived.active)
+
     def test_error_code_with_sop(self):
         """Test error code linked to SOP"""
         sop = self.SopDocument.create({
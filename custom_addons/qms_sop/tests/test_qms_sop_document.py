@@ -2,8 +2,11 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo.tests.common import TransactionCase
+from psycopg2 import IntegrityError
+
 from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase
+from odoo.tools import mute_logger
 
 
 class TestQmsSopDocument(TransactionCase):
@@ -37,21 +40,43 @@ class TestQmsSopDocument(TransactionCase):
             'category': 'build',
         })
 
-        with self.assertRaises(Exception):
+        with self.assertRaises(ValidationError):
             self.SopDocument.create({
                 'name': 'Second SOP',
                 'code': 'SOP-DUP-001',
                 'category': 'deploy',
             })
 
+    def test_sop_code_reuse_archived_code(self):
+        """Test an archived SOP does not block reusing its code"""
+        archived = self.SopDocument.create({
+            'name': 'Old SOP',
+            'code': 'SOP-REUSE-001',
+            'category': 'build',
+        })
+        archived.active = False
+        archived.flush_recordset()
+
+        sop = self.SopDocument.create({
+            'name': 'New SOP',
+            'code': 'SOP-REUSE-001',
+            'category': 'build',
+        })
+        self.env.flush_all()
+
+        self.assertTrue(sop.active)
+        self.assertFalse(archived.active)
+
+    @mute_logger('odoo.sql_db')
     def test_sop_code_validation(self):
         """Test SOP code format validation"""
-        with self.assertRaises(ValidationError):
+        with self.assertRaises(IntegrityError):
             self.SopDocument.create({
                 'name': 'Invalid Code SOP',
                 'code': 'INVALID-001',
                 'category': 'build',
             })
+            self.env.flush_all()
 
     def test_sop_with_steps(self):
         """Test SOP with execution steps"""
@@ -8,39 +8,30 @@ from odoo.tests.common import TransactionCase
 class TestQmsSopRun(TransactionCase):
     """Test QMS SOP Run model and workflow"""
 
-    def setUp(self):
-        super().setUp()
-        self.SopDocument = self.env['qms.sop.document']
-        self.SopStep = self.env['qms.sop.step']
-        self.SopRun = self.env['qms.sop.run']
-        self.SopRunStep = self.env['qms.sop.run.step']
-        self.SopRunError = self.env['qms.sop.run.error']
-        self.ErrorCode = self.env['qms.error.code']
-
-        # Create test SOP with steps
-        self.sop = self.SopDocument.create({
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.SopRun = cls.env['qms.sop.run']
+        cls.SopRunStep = cls.env['qms.sop.run.step']
+        cls.SopRunError = cls.env['qms.sop.run.error']
+        cls.ErrorCode = cls.env['qms.error.code']
+
+        # Create test SOP with steps once; tests only add runs to it
+        cls.sop = cls.env['qms.sop.document'].create({
             'name': 'Test Deployment',
             'code': 'SOP-RUN-001',
             'category': 'deploy',
         })
 
-        self.step1 = self.SopStep.create({
-            'sop_id': self.sop.id,
-            'sequence': 10,
-            'title': 'Prepare environment',
-        })
-
-        self.step2 = self.SopStep.create({
-            'sop_id': self.sop.id,
-            'sequence': 20,
-            'title': 'Execute deployment',
-        })
-
-        self.step3 = self.SopStep.create({
-            'sop_id': self.sop.id,
-            'sequence': 30,
-            'title': 'Verify deployment',
-        })
+        cls.step1, cls.step2, cls.step3 = cls.env['qms.sop.step'].create([{
+            'sop_id': cls.sop.id,
+            'sequence': sequence,
+            'title': title,
+        } for sequence, title in [
+            (10, 'Prepare environment'),
+            (20, 'Execute deployment'),
+            (30, 'Verify deployment'),
+        ]])
 
     def test_sop_run_creation(self):
         """Test SOP run creation with auto-generated step runs"""
@@ -50,8 +41,8 @@ class TestQmsSopRun(TransactionCase):
 
         self.assertEqual(run.state, 'draft')
         self.assertEqual(run.started_by, self.env.user)
-        self.assertEqual(len(run.step_run_ids), 3)
-        self.assertTrue(all(s.state == 'pending' for s in run.step_run_ids))
+        self.assertEqual(self.SopRunStep.search_count([('run_id', '=', run.id)]), 3)
+        self.assertEqual(set(run.step_run_ids.mapped('state')), {'pending'})
 
     def test_sop_run_workflow(self):
         """Test complete SOP run workflow"""
@@ -61,13 +52,15 @@ class TestQmsSopRun(TransactionCase):
 
         # Start run
         run.action_start()
-        self.assertEqual(run.state, 'in_progress')
-        self.assertTrue(run.start_date)
+        vals = run.read(['state', 'start_date'])[0]
+        self.assertEqual(vals['state'], 'in_progress')
+        self.assertTrue(vals['start_date'])
 
         # Complete run
         run.action_complete()
-        self.assertEqual(run.state, 'completed')
-        self.assertTrue(run.end_date)
+        vals = run.read(['state', 'end_date'])[0]
+        self.assertEqual(vals['state'], 'completed')
+        self.assertTrue(vals['end_date'])
 
     def test_sop_run_failure(self):
         """Test SOP run failure state"""
@@ -78,8 +71,9 @@ class TestQmsSopRun(TransactionCase):
         run.action_start()
         run.action_fail()
 
-        self.assertEqual(run.state, 'failed')
-        self.assertTrue(run.end_date)
+        vals = run.read(['state', 'end_date'])[0]
+        self.assertEqual(vals['state'], 'failed')
+        self.assertTrue(vals['end_date'])
 
     def test_step_run_workflow(self):
         """Test individual step run workflow"""
@@ -91,13 +85,15 @@ class TestQmsSopRun(TransactionCase):
 
         # Start step
         step_run.action_start()
-        self.assertEqual(step_run.state, 'in_progress')
-        self.assertTrue(step_run.started_at)
+        vals = step_run.read(['state', 'started_at'])[0]
+        self.assertEqual(vals['state'], 'in_progress')
+        self.assertTrue(vals['started_at'])
 
         # Complete step
         step_run.action_complete()
-        self.assertEqual(step_run.state, 'completed')
-        self.assertTrue(step_run.completed_at)
+        vals = step_run.read(['state', 'completed_at'])[0]
+        self.assertEqual(vals['state'], 'completed')
+        self.assertTrue(vals['completed_at'])
 
     def test_step_run_failure(self):
         """Test step run failure"""
@@ -110,8 +106,9 @@ class TestQmsSopRun(TransactionCase):
         step_run.action_start()
         step_run.action_fail()
 
-        self.assertEqual(step_run.state, 'failed')
-        self.assertTrue(step_run.completed_at)
+        vals = step_run.read(['state', 'completed_at'])[0]
+        self.assertEqual(vals['state'], 'failed')
+        self.assertTrue(vals['completed_at'])
 
     def test_step_run_skip(self):
         """Test step run skip"""
@@ -123,8 +120,9 @@ class TestQmsSopRun(TransactionCase):
 
         step_run.action_skip()
 
-        self.assertEqual(step_run.state, 'skipped')
-        self.assertTrue(step_run.completed_at)
+        vals = step_run.read(['state', 'completed_at'])[0]
+        self.assertEqual(vals['state'], 'skipped')
+        self.assertTrue(vals['completed_at'])
 
     def test_error_tracking(self):
         """Test error tracking during SOP run"""
@@ -147,7 +145,7 @@ class TestQmsSopRun(TransactionCase):
             'description': 'Health check failed after deployment',
         })
 
-        self.assertEqual(len(run.error_ids), 1)
+        self.assertEqual(self.SopRunError.search_count([('run_id', '=', run.id)]), 1)
         self.assertEqual(error.error_code, 'DEPLOY_FAIL')
         self.assertEqual(error.error_severity, 'critical')
 
@@ -161,9 +159,7 @@ class TestQmsSopRun(TransactionCase):
             'sop_id': self.sop.id,
         })
 
-        self.assertEqual(len(self.sop.run_ids), 2)
-        self.assertIn(run1, self.sop.run_ids)
-        self.assertIn(run2, self.sop.run_ids)
+        self.assertEqual(set(self.sop.run_ids.ids), {run1.id, run2.id})
 
         # Verify runs are independent
         run1.action_start()
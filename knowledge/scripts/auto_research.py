@@ -13,6 +13,8 @@ import logging
 import os
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -20,6 +22,23 @@ from urllib.parse import quote_plus
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    # Optional C-accelerated JSON parser for large API responses
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    # Optional persistent HTTP cache with ETag revalidation
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# On-disk HTTP cache for GitHub responses (used when requests-cache is installed)
+HTTP_CACHE_PATH = Path.home() / '.cache' / 'auto_research' / 'github'
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +48,67 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def build_session(headers: Optional[Dict] = None, cache_path: Optional[Path] = None) -> requests.Session:
+    """Create a pooled keep-alive session with retry/backoff for crawlers
+
+    With `cache_path` and requests-cache installed, responses are kept in
+    a SQLite cache and revalidated with If-None-Match/If-Modified-Since
+    once stale, so unchanged resources come back as bodiless 304s.
+    """
+
+    if cache_path and requests_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        session = requests_cache.CachedSession(
+            str(cache_path),
+            backend='sqlite',
+            expire_after=3600,
+            cache_control=True,
+        )
+    else:
+        session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def item_date(item: Dict, now: Optional[datetime] = None) -> datetime:
+    """Return a result's creation datetime, falling back to `now`
+
+    Reddit/Stack Overflow results carry a raw epoch in `created_ts` that
+    is only turned into a datetime here, for results that get cited.
+    The fallback is only evaluated when no date is present, unlike a
+    nested dict.get() default which builds a datetime on every call.
+    """
+
+    ts = item.get('created_ts')
+    if ts is not None:
+        return datetime.fromtimestamp(ts)
+    date = item.get('created') or item.get('date')
+    if date is None:
+        date = now or datetime.now()
+    return date
+
+
+def item_year(item: Dict) -> int:
+    """Return a result's creation year without building a datetime"""
+
+    ts = item.get('created_ts')
+    if ts is not None:
+        return time.localtime(ts).tm_year
+    return item_date(item).year
+
+
 class QualityScorer:
     """Calculate quality scores for research sources"""
 
@@ -64,9 +144,13 @@ class QualityScorer:
     MIN_ACCEPTABLE_SCORE = 60
 
     @staticmethod
-    def calculate(source_type: str, date: datetime, upvotes: int = 0,
-                  accepted: bool = False, oca_aligned: bool = False) -> int:
-        """Calculate total quality score for a source"""
+    def calculate(source_type: str, date: Optional[datetime] = None, upvotes: int = 0,
+                  accepted: bool = False, oca_aligned: bool = False,
+                  year: Optional[int] = None) -> int:
+        """Calculate total quality score for a source
+
+        Pass either `date` or, when only the year is known, `year`.
+        """
 
         # Base score
         score = 0
@@ -90,7 +174,8 @@ class QualityScorer:
             score = QualityScorer.QUALITY_SCORES['official_odoo_docs']
 
         # Recency bonus
-        year = date.year
+        if year is None:
+            year = date.year
         if year >= 2021:
             recency = QualityScorer.RECENCY_BONUS.get(year, -20)
             score += recency
@@ -101,6 +186,20 @@ class QualityScorer:
 
         return score
 
+    @staticmethod
+    def score_item(item: Dict) -> int:
+        """Score a crawler result once and memoize it on the item"""
+
+        if '_score' not in item:
+            item['_score'] = QualityScorer.calculate(
+                source_type=item['source_type'],
+                year=item_year(item),
+                upvotes=item.get('upvotes', 0),
+                accepted=item.get('accepted', False),
+                oca_aligned=item['source_type'] == 'oca'
+            )
+        return item['_score']
+
     @staticmethod
     def is_acceptable(score: int) -> bool:
         """Check if score meets minimum threshold"""
@@ -112,12 +211,30 @@ class OCAGitHubCrawler:
 
     BASE_URL = "https://api.github.com"
 
+    # Upper bound on bytes downloaded per file for snippet extraction
+    MAX_CONTENT_BYTES = 64 * 1024
+
+    # Key patterns worth quoting, as one alternation scanned once per line
+    SNIPPET_RE = re.compile(
+        r'@api\.depends'
+        r'|def _compute'
+        r'|@api\.constrains'
+        r'|def create\('
+        r'|def write\('
+        r'|class.*\(models\.'
+    )
+
     def __init__(self, github_token: Optional[str] = None):
         self.token = github_token or os.environ.get('GITHUB_TOKEN')
         self.headers = {}
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
         self.headers['Accept'] = 'application/vnd.github.v3+json'
+        self.session = build_session(self.headers, cache_path=HTTP_CACHE_PATH)
+        # raw.githubusercontent.com must not receive the API auth header.
+        # Not cached: requests-cache would download and store whole files,
+        # defeating the MAX_CONTENT_BYTES cap in get_file_content()
+        self.raw_session = build_session()
 
     def search_code(self, query: str, repo: str = None, limit: int = 10) -> List[Dict]:
         """Search OCA code for patterns"""
@@ -130,10 +247,11 @@ class OCAGitHubCrawler:
         params = {'q': search_query, 'per_page': limit}
 
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            results = response.json()
+            results = json_loads(response.content)
 
+            now = datetime.now()
             items = []
             for item in results.get('items', []):
                 items.append({
@@ -142,13 +260,13 @@ class OCAGitHubCrawler:
                     'path': item['path'],
                     'repo': item['repository']['full_name'],
                     'source_type': 'oca',
-                    'date': datetime.now(),  # GitHub code search doesn't provide dates
+                    'date': now,  # GitHub code search doesn't provide dates
                 })
 
             logger.info(f"Found {len(items)} OCA code results for: {query}")
             return items
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"GitHub API error: {e}")
             return []
 
@@ -159,9 +277,17 @@ class OCAGitHubCrawler:
         raw_url = url.replace('github.com', 'raw.githubusercontent.com').replace('/blob/', '/')
 
         try:
-            response = requests.get(raw_url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            # Snippets come from the top of the file; stop reading after a prefix
+            with self.raw_session.get(raw_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                chunks = []
+                total = 0
+                for chunk in response.iter_content(chunk_size=8192):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= self.MAX_CONTENT_BYTES:
+                        break
+                return b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
         except requests.RequestException as e:
             logger.error(f"Error fetching file content: {e}")
             return None
@@ -174,22 +300,11 @@ class OCAGitHubCrawler:
 
         lines = content.split('\n')
 
-        # Look for key patterns
-        patterns = [
-            r'@api\.depends',
-            r'def _compute',
-            r'@api\.constrains',
-            r'def create\(',
-            r'def write\(',
-            r'class.*\(models\.',
-        ]
-
         for i, line in enumerate(lines):
-            for pattern in patterns:
-                if re.search(pattern, line):
-                    # Return this line and next (max 2 lines)
-                    snippet_lines = lines[i:min(i+max_lines, len(lines))]
-                    return '\n'.join(snippet_lines).strip()
+            if self.SNIPPET_RE.search(line):
+                # Return this line and next (max 2 lines)
+                snippet_lines = lines[i:i + max_lines]
+                return '\n'.join(snippet_lines).strip()
 
         # Fallback: return first non-empty lines
         non_empty = [l.strip() for l in lines if l.strip()]
@@ -205,6 +320,7 @@ class RedditCrawler:
         self.headers = {
             'User-Agent': 'Cline Deep Research Bot 1.0'
         }
+        self.session = build_session(self.headers)
 
     def search(self, query: str, min_upvotes: int = 5, limit: int = 10) -> List[Dict]:
         """Search r/odoo subreddit"""
@@ -218,9 +334,9 @@ class RedditCrawler:
         }
 
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             items = []
             for post in data.get('data', {}).get('children', []):
@@ -235,7 +351,7 @@ class RedditCrawler:
                     'title': post_data['title'],
                     'url': f"{self.BASE_URL}{post_data['permalink']}",
                     'upvotes': upvotes,
-                    'created': datetime.fromtimestamp(post_data['created_utc']),
+                    'created_ts': post_data['created_utc'],
                     'source_type': 'reddit',
                     'selftext': post_data.get('selftext', '')[:200],  # First 200 chars
                 })
@@ -243,7 +359,7 @@ class RedditCrawler:
             logger.info(f"Found {len(items)} Reddit results for: {query}")
             return items
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Reddit API error: {e}")
             return []
 
@@ -253,6 +369,9 @@ class StackOverflowCrawler:
 
     BASE_URL = "https://api.stackexchange.com/2.3"
 
+    def __init__(self):
+        self.session = build_session()
+
     def search(self, query: str, min_upvotes: int = 10, limit: int = 10) -> List[Dict]:
         """Search Stack Overflow [odoo] tag"""
 
@@ -268,9 +387,9 @@ class StackOverflowCrawler:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             items = []
             for item in data.get('items', []):
@@ -284,7 +403,7 @@ class StackOverflowCrawler:
                     'title': item['title'],
                     'url': item['link'],
                     'upvotes': upvotes,
-                    'created': datetime.fromtimestamp(item['creation_date']),
+                    'created_ts': item['creation_date'],
                     'accepted': item.get('is_answered', False),
                     'source_type': 'stackoverflow',
                     'body_preview': item.get('body', '')[:200],
@@ -293,7 +412,7 @@ class StackOverflowCrawler:
             logger.info(f"Found {len(items)} Stack Overflow results for: {query}")
             return items
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Stack Overflow API error: {e}")
             return []
 
@@ -306,17 +425,11 @@ class CitationFormatter:
                application: List[str] = None, tags: List[str] = None) -> str:
         """Format item as markdown citation"""
 
-        # Calculate quality score
-        score = QualityScorer.calculate(
-            source_type=item['source_type'],
-            date=item.get('created', item.get('date', datetime.now())),
-            upvotes=item.get('upvotes', 0),
-            accepted=item.get('accepted', False),
-            oca_aligned=item['source_type'] == 'oca'
-        )
+        # Quality score (computed once per item)
+        score = QualityScorer.score_item(item)
 
         # Format date
-        date_str = item.get('created', item.get('date', datetime.now())).strftime('%Y-%m-%d')
+        date_str = item_date(item).strftime('%Y-%m-%d')
 
         # Default values
         application = application or ['odoo-module-dev']
@@ -341,6 +454,27 @@ class CitationFormatter:
 class ResearchAutomation:
     """Main research automation orchestrator"""
 
+    # Concurrent crawler requests per run
+    MAX_WORKERS = 8
+
+    # Title keyword -> tag
+    TAG_KEYWORDS = {
+        'computed': 'computed-field',
+        'api.depends': 'api-depends',
+        'record rule': 'record-rules',
+        'security': 'security',
+        'performance': 'performance',
+        'docker': 'docker',
+        'wkhtmltopdf': 'wkhtmltopdf',
+        'test': 'testing',
+        'migration': 'migration',
+        'orm': 'orm',
+    }
+
+    # Title keywords mapping a result to a skill
+    MODULE_DEV_RE = re.compile(r'orm|model|computed|api|security')
+    DOCKER_RE = re.compile(r'docker|container|wkhtmltopdf')
+
     def __init__(self, test_mode: bool = False):
         self.test_mode = test_mode
         self.oca_crawler = OCAGitHubCrawler()
@@ -388,28 +522,36 @@ class ResearchAutomation:
         logger.info(f"Starting research for domain: {domain}")
 
         queries = self.queries.get(domain, {})
-        results = []
 
-        # OCA GitHub queries
+        searches = []
         for query in queries.get('oca', []):
-            items = self.oca_crawler.search_code(query, limit=3)
-            for item in items[:max_results]:
-                # Fetch content and extract snippet
-                content = self.oca_crawler.get_file_content(item['url'])
-                snippet = self.oca_crawler.extract_snippet(content)
-                item['snippet'] = snippet
-                results.append(item)
-
-        # Reddit queries
+            searches.append((self.oca_crawler.search_code, query, {'limit': 3}))
         for query in queries.get('reddit', []):
-            items = self.reddit_crawler.search(query, min_upvotes=5, limit=3)
-            results.extend(items[:max_results])
+            searches.append((self.reddit_crawler.search, query, {'min_upvotes': 5, 'limit': 3}))
 
         # Stack Overflow queries (limit in test mode to avoid rate limits)
         if not self.test_mode:
             for query in queries.get('stackoverflow', []):
-                items = self.stackoverflow_crawler.search(query, min_upvotes=10, limit=3)
-                results.extend(items[:max_results])
+                searches.append((self.stackoverflow_crawler.search, query, {'min_upvotes': 10, 'limit': 3}))
+
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            # Searches are I/O bound; results keep query order
+            futures = [executor.submit(search, query, **kwargs) for search, query, kwargs in searches]
+            results = []
+            seen_urls = set()
+            for future in futures:
+                for item in future.result()[:max_results]:
+                    # Overlapping queries return the same pages; keep the first
+                    if item['url'] in seen_urls:
+                        continue
+                    seen_urls.add(item['url'])
+                    results.append(item)
+
+            # Fetch OCA file contents concurrently and extract snippets
+            oca_items = [item for item in results if item['source_type'] == 'oca']
+            contents = executor.map(lambda item: self.oca_crawler.get_file_content(item['url']), oca_items)
+            for item, content in zip(oca_items, contents):
+                item['snippet'] = self.oca_crawler.extract_snippet(content)
 
         logger.info(f"Research complete. Found {len(results)} total results")
         return results
@@ -424,10 +566,11 @@ class ResearchAutomation:
             takeaway = self._generate_takeaway(item)
 
             # Auto-tag based on content
-            tags = self._generate_tags(item)
+            title_lower = item['title'].lower()
+            tags = self._generate_tags(item, title_lower)
 
             # Determine application
-            application = self._determine_application(item)
+            application = self._determine_application(item, title_lower)
 
             # Format citation
             citation = CitationFormatter.format(
@@ -460,49 +603,28 @@ class ResearchAutomation:
 
         return "Manual review required"
 
-    def _generate_tags(self, item: Dict) -> List[str]:
+    def _generate_tags(self, item: Dict, title_lower: str) -> List[str]:
         """Auto-generate tags from item content"""
 
-        tags = []
-
-        # Extract from title
-        title_lower = item['title'].lower()
-
-        keyword_map = {
-            'computed': 'computed-field',
-            'api.depends': 'api-depends',
-            'record rule': 'record-rules',
-            'security': 'security',
-            'performance': 'performance',
-            'docker': 'docker',
-            'wkhtmltopdf': 'wkhtmltopdf',
-            'test': 'testing',
-            'migration': 'migration',
-            'orm': 'orm',
-        }
-
-        for keyword, tag in keyword_map.items():
-            if keyword in title_lower:
-                tags.append(tag)
+        # Extract from (pre-lowercased) title
+        tags = [tag for keyword, tag in self.TAG_KEYWORDS.items() if keyword in title_lower]
 
         # Add source type as tag
         tags.append(item['source_type'])
 
         return tags
 
-    def _determine_application(self, item: Dict) -> List[str]:
+    def _determine_application(self, item: Dict, title_lower: str) -> List[str]:
         """Determine which skills this applies to"""
 
         applications = []
 
-        title_lower = item['title'].lower()
-
         # Module development
-        if any(k in title_lower for k in ['orm', 'model', 'computed', 'api', 'security']):
+        if self.MODULE_DEV_RE.search(title_lower):
             applications.append('odoo-module-dev')
 
         # Docker
-        if any(k in title_lower for k in ['docker', 'container', 'wkhtmltopdf']):
+        if self.DOCKER_RE.search(title_lower):
             applications.append('odoo-docker-claude')
 
         # Default
@@ -523,20 +645,23 @@ class ResearchAutomation:
         today = datetime.now().strftime('%Y-%m-%d')
         note_path = output_dir / f"{today}.md"
 
-        # Create header if new file
-        if not note_path.exists():
-            header = f"""# Daily Research Notes - {today}
+        # Start from the existing note, or a header for a new file
+        if note_path.exists():
+            existing = note_path.read_text()
+        else:
+            existing = f"""# Daily Research Notes - {today}
 
 **Auto-generated research findings**
 
 ---
 
 """
-            note_path.write_text(header)
 
-        # Append citations
-        with open(note_path, 'a') as f:
-            f.write(citations)
+        # Write header + citations in one pass and swap the file in
+        # atomically so a crash never leaves a half-written note
+        tmp_path = note_path.with_name(f".{note_path.name}.tmp")
+        tmp_path.write_text(existing + citations)
+        os.replace(tmp_path, note_path)
 
         logger.info(f"Saved citations to: {note_path}")
         return note_path
@@ -578,15 +703,7 @@ def main():
     # Filter by quality score
     filtered_results = [
         r for r in results
-        if QualityScorer.is_acceptable(
-            QualityScorer.calculate(
-                r['source_type'],
-                r.get('created', r.get('date', datetime.now())),
-                r.get('upvotes', 0),
-                r.get('accepted', False),
-                r['source_type'] == 'oca'
-            )
-        )
+        if QualityScorer.is_acceptable(QualityScorer.score_item(r))
     ]
 
     logger.info(f"Filtered to {len(filtered_results)} high-quality results")
@@ -7,7 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class AgentConfig(BaseModel):
     """Base configuration for Odoo agents."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     name: str = Field(..., description="Agent name")
     version: str = Field(default="0.1.0", description="Agent version")
@@ -36,3 +36,11 @@ def test_agent_config_validation():
     # Name is required
     with pytest.raises(Exception):
         AgentConfig()
+
+
+def test_agent_config_frozen():
+    """Test configuration is immutable once built."""
+    config = AgentConfig(name="FrozenAgent")
+
+    with pytest.raises(Exception):
+        config.name = "Renamed"
@@ -1,9 +1,11 @@
 """Configuration for module development agent."""
 
-from typing import Optional, List
+from typing import Tuple
 from pydantic import Field
 from odoo_agent_core import AgentConfig
 
+_DEFAULT_TOOLS: Tuple[str, ...] = ("Read", "Write", "Edit", "Bash", "Grep", "Glob")
+
 
 class ModuleConfig(AgentConfig):
     """Configuration for Odoo module development."""
@@ -13,7 +15,7 @@ class ModuleConfig(AgentConfig):
     oca_compliant: bool = Field(default=True, description="Follow OCA guidelines")
     include_tests: bool = Field(default=True, description="Generate test files")
     include_migrations: bool = Field(default=True, description="Generate migration scripts")
-    allowed_tools: List[str] = Field(
-        default=["Read", "Write", "Edit", "Bash", "Grep", "Glob"],
+    allowed_tools: Tuple[str, ...] = Field(
+        default_factory=lambda: _DEFAULT_TOOLS,
         description="Allowed tools for the agent"
     )
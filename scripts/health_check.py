@@ -3,10 +3,10 @@
 Comprehensive Health Check Script for Odoo Blue-Green Deployment
 
 This script validates Odoo environment health across multiple dimensions:
-- Basic liveness (HTTP response)
+- Basic liveness (HTTP response; the only check with --fast)
 - Database connectivity and query performance
 - Odoo server responsiveness and module loading
-- Critical workflow smoke tests
+- Critical workflow smoke tests (read-only; CRUD with --deep-workflow)
 - Performance metrics validation
 
 Exit codes:
@@ -16,14 +16,36 @@ Exit codes:
 """
 
 import argparse
+import functools
+import heapq
+import http.client
+import itertools
 import json
+import math
+import queue
 import sys
+import threading
 import time
-from typing import Dict, List, Tuple
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
 import socket
-import xmlrpc.client
+
+try:
+    # Optional C-accelerated JSON codec for JSON-RPC payloads
+    import orjson
+    from orjson import dumps as json_dumps, loads as json_loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
 
 # Color codes for terminal output
 class Colors:
@@ -34,18 +56,160 @@ class Colors:
     RESET = '\033[0m'
 
 
+# Healthy results of slow-changing checks, keyed by (base_url, db_name, check)
+_CHECK_CACHE: Dict[Tuple, Tuple[float, Dict]] = {}
+_CHECK_CACHE_LOCK = threading.Lock()
+
+
+def ttl_cached(check_name: str, seconds: float):
+    """Reuse a healthy check result for `seconds` when checks run repeatedly"""
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self):
+            key = (self.base_url, self.db_name, check_name)
+            with _CHECK_CACHE_LOCK:
+                cached = _CHECK_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < seconds:
+                self._record_check(check_name, dict(cached[1], cached=True))
+                self._ok(f"{cached[1]['message']} (cached)")
+                return
+
+            check(self)
+
+            result = self.results['checks'].get(check_name)
+            if result and result['status'] == 'healthy':
+                with _CHECK_CACHE_LOCK:
+                    _CHECK_CACHE[key] = (time.monotonic(), result)
+        return wrapper
+    return decorator
+
+
+def healthcheck(check_name: str, label: str, failure: str):
+    """Announce a check and record any exception it raises as unhealthy
+
+    The wrapped method receives the check name and only has to record its
+    own outcome.
+    """
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self):
+            self._progress(f"  → {label}...")
+            try:
+                check(self, check_name)
+            except Exception as e:
+                self._mark_unhealthy(check_name, f'{failure}: {e}')
+                self._fail(f"{failure}: {e}")
+        return wrapper
+    return decorator
+
+
+class RPCError(Exception):
+    """Error returned by the Odoo JSON-RPC endpoint"""
+
+
+class ConnectionPool:
+    """Keep-alive HTTP connections to a single host, shared across threads"""
+
+    def __init__(self, base_url: str, maxsize: int = 8, timeout: int = 30):
+        parsed = urlparse(base_url)
+        if parsed.scheme == 'https':
+            self._connection_class = http.client.HTTPSConnection
+        else:
+            self._connection_class = http.client.HTTPConnection
+        self._host = parsed.hostname or 'localhost'
+        self._port = parsed.port
+        self._prefix = parsed.path.rstrip('/')
+        self.timeout = timeout
+        # time.monotonic() by which every request must have completed
+        self.deadline: Optional[float] = None
+        self._idle = queue.LifoQueue(maxsize)
+
+    def _connect(self):
+        return self._connection_class(self._host, self._port, timeout=self.timeout)
+
+    def _set_timeout(self, conn):
+        """Cap the socket timeout of conn by the time left until the deadline"""
+        timeout = self.timeout
+        if self.deadline is not None:
+            timeout = min(timeout, self.deadline - time.monotonic())
+            if timeout <= 0:
+                raise socket.timeout('deadline exceeded')
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+    def request(self, method: str, path: str, body: bytes = None,
+                headers: Dict = None) -> Tuple[int, bytes]:
+        """Send a request on a pooled connection and return (status, body)"""
+        try:
+            conn, reused = self._idle.get_nowait(), True
+        except queue.Empty:
+            conn, reused = self._connect(), False
+
+        while True:
+            try:
+                self._set_timeout(conn)
+                conn.request(method, self._prefix + path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection: retry once
+                conn, reused = self._connect(), False
+            except Exception:
+                conn.close()
+                raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+        return response.status, data
+
+
 class HealthChecker:
     """Comprehensive health check for Odoo environments"""
 
+    # Number of concurrent /web/health probes in the response time check
+    RESPONSE_TIME_SAMPLES = 5
+
     def __init__(self, base_url: str, db_name: str = "postgres",
                  username: str = "admin", password: str = "admin",
-                 timeout: int = 30, comprehensive: bool = False):
+                 timeout: int = 30, comprehensive: bool = False,
+                 quiet: bool = False, deep_workflow: bool = False,
+                 fast: bool = False):
         self.base_url = base_url.rstrip('/')
         self.db_name = db_name
         self.username = username
         self.password = password
         self.timeout = timeout
         self.comprehensive = comprehensive
+        self._quiet = quiet
+        self.deep_workflow = deep_workflow
+        self.fast = fast
+        # Parse the URL and build the endpoints once for all checks
+        parsed = urlparse(self.base_url)
+        self._host = parsed.hostname or 'localhost'
+        self._port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        # HTTP and JSON-RPC calls reuse keep-alive connections instead of a
+        # new TCP (and TLS) handshake per request
+        self._http = ConnectionPool(self.base_url, maxsize=8, timeout=timeout)
+        # Checks run concurrently and all report into self.results
+        self._lock = threading.Lock()
+        self._print_lock = threading.Lock()
+        # Set once the deadline has passed: late checks are then ignored
+        self._closed = threading.Event()
+        # Shared login for the comprehensive checks, see _ensure_authenticated()
+        self._auth_lock = threading.Lock()
+        self._uid = None
+        self._auth_error = None
+        self._rpc_ids = itertools.count(1)
         self.results = {
             'status': 'healthy',
             'checks': {},
@@ -53,367 +217,404 @@ class HealthChecker:
             'metadata': {
                 'base_url': base_url,
                 'database': db_name,
-                'comprehensive': comprehensive
+                'comprehensive': comprehensive,
+                'fast': fast
             }
         }
 
     def run_all_checks(self) -> Dict:
         """Run all health checks and return results"""
-        print(f"{Colors.BLUE}🏥 Running health checks on {self.base_url}...{Colors.RESET}\n")
+        self._log(f"{Colors.BLUE}🏥 Running health checks on {self.base_url}...{Colors.RESET}\n")
+
+        # Readiness probe: a single keep-alive GET, no threads and no login
+        if self.fast:
+            self._check_basic_health_endpoint()
+            self._closed.set()
+            self._print_summary()
+            return self.results
 
         # Basic checks (always run)
-        self._check_http_connectivity()
-        self._check_basic_health_endpoint()
-        self._check_database_connectivity()
-        self._check_odoo_responsiveness()
+        checks = [
+            ('http_connectivity', self._check_http_connectivity),
+            ('health_endpoint', self._check_basic_health_endpoint),
+            ('database_connectivity', self._check_database_connectivity),
+            ('odoo_responsiveness', self._check_odoo_responsiveness),
+        ]
 
         # Comprehensive checks (optional)
         if self.comprehensive:
-            print(f"\n{Colors.BLUE}📋 Running comprehensive checks...{Colors.RESET}\n")
-            self._check_module_loading()
-            self._check_filestore_access()
-            self._check_response_time()
-            self._check_critical_workflows()
+            self._log(f"{Colors.BLUE}📋 Including comprehensive checks...{Colors.RESET}\n")
+            checks += [
+                ('module_loading', self._check_module_loading),
+                ('filestore_access', self._check_filestore_access),
+                ('response_time', self._check_response_time),
+            ]
+            if self.deep_workflow:
+                checks.append(('critical_workflows', self._check_critical_workflows))
+            else:
+                checks.append(('workflow_smoke', self._check_workflow_smoke))
+
+        # The checks are independent and I/O bound: run them concurrently so
+        # wall time is that of the slowest check rather than the sum of all.
+        # All checks start together, so the deadline applies to each of them.
+        # Their requests are cut off at the deadline too, so no worker is
+        # left running that the interpreter would wait for at exit.
+        self._http.deadline = time.monotonic() + self.timeout
+        executor = ThreadPoolExecutor(max_workers=len(checks))
+        try:
+            futures = {executor.submit(check): name for name, check in checks}
+            try:
+                for future in as_completed(futures, timeout=self.timeout):
+                    future.result()
+            except TimeoutError:
+                for future, name in futures.items():
+                    if not future.done():
+                        self._mark_unhealthy(name, f'exceeded {self.timeout}s deadline')
+                        self._fail(f"{name} exceeded {self.timeout}s deadline")
+        finally:
+            self._closed.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # Print summary
         self._print_summary()
 
         return self.results
 
-    def _check_http_connectivity(self):
-        """Check 1: Basic HTTP connectivity"""
-        check_name = "http_connectivity"
-        print(f"  → Checking HTTP connectivity...")
+    @healthcheck('http_connectivity', 'Checking HTTP connectivity', 'Connectivity check failed')
+    def _check_http_connectivity(self, check_name):
+        """Check 1: Basic HTTP connectivity (host name resolution)"""
+        host, port = self._host, self._port
 
-        try:
-            # Parse URL to get host and port
-            from urllib.parse import urlparse
-            parsed = urlparse(self.base_url)
-            host = parsed.hostname or 'localhost'
-            port = parsed.port or (443 if parsed.scheme == 'https' else 80)
-
-            # Try TCP connection
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((host, port))
-            sock.close()
-
-            if result == 0:
-                self.results['checks'][check_name] = {
-                    'status': 'healthy',
-                    'message': f'TCP connection successful to {host}:{port}'
-                }
-                print(f"    {Colors.GREEN}✓ TCP connection successful{Colors.RESET}")
-            else:
-                self._mark_unhealthy(check_name, f'Cannot connect to {host}:{port}')
-                print(f"    {Colors.RED}✗ TCP connection failed{Colors.RESET}")
+        # Only resolve the address: opening (and dropping) a bare TCP
+        # connection costs a handshake and proves nothing about the app,
+        # which the health endpoint check exercises properly.
+        start_time = time.perf_counter()
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        resolve_time = time.perf_counter() - start_time
 
-        except Exception as e:
-            self._mark_unhealthy(check_name, str(e))
-            print(f"    {Colors.RED}✗ Connectivity check failed: {e}{Colors.RESET}")
+        self._record_check(check_name, {
+            'status': 'healthy',
+            'message': f'{host}:{port} resolved to {addresses[0][4][0]}',
+            'resolve_time_ms': round(resolve_time * 1000, 2)
+        })
+        self._ok(f"{host} resolved ({resolve_time*1000:.0f}ms)")
 
-    def _check_basic_health_endpoint(self):
+    @healthcheck('health_endpoint', 'Checking /web/health endpoint', 'Health endpoint check failed')
+    def _check_basic_health_endpoint(self, check_name):
         """Check 2: Basic health endpoint (/web/health)"""
-        check_name = "health_endpoint"
-        print(f"  → Checking /web/health endpoint...")
-
-        try:
-            url = f"{self.base_url}/web/health"
-            req = Request(url)
-            req.add_header('User-Agent', 'HealthChecker/1.0')
-
-            with urlopen(req, timeout=self.timeout) as response:
-                status_code = response.getcode()
-                content = response.read().decode('utf-8')
-
-                if status_code == 200:
-                    self.results['checks'][check_name] = {
-                        'status': 'healthy',
-                        'message': 'Health endpoint responding',
-                        'http_status': status_code,
-                        'response': content.strip()
-                    }
-                    print(f"    {Colors.GREEN}✓ Health endpoint OK (200){Colors.RESET}")
-                else:
-                    self._mark_unhealthy(check_name, f'HTTP {status_code}: {content}')
-                    print(f"    {Colors.RED}✗ Health endpoint returned {status_code}{Colors.RESET}")
-
-        except URLError as e:
-            self._mark_unhealthy(check_name, f'URLError: {e.reason}')
-            print(f"    {Colors.RED}✗ Health endpoint unreachable: {e.reason}{Colors.RESET}")
-        except Exception as e:
-            self._mark_unhealthy(check_name, str(e))
-            print(f"    {Colors.RED}✗ Health endpoint check failed: {e}{Colors.RESET}")
-
-    def _check_database_connectivity(self):
-        """Check 3: Database connectivity via XML-RPC"""
-        check_name = "database_connectivity"
-        print(f"  → Checking database connectivity...")
-
         try:
-            # Test database list endpoint (doesn't require auth)
-            db_list_url = f"{self.base_url}/xmlrpc/2/db"
-            db_proxy = xmlrpc.client.ServerProxy(db_list_url, allow_none=True)
+            status_code, body = self._http.request(
+                'GET', '/web/health', headers={'User-Agent': 'HealthChecker/1.0'})
+            content = body.decode('utf-8')
 
-            # List databases (with timeout)
-            socket.setdefaulttimeout(self.timeout)
-            databases = db_proxy.list()
-
-            if self.db_name in databases:
-                self.results['checks'][check_name] = {
+            if 200 <= status_code < 300:
+                self._record_check(check_name, {
                     'status': 'healthy',
-                    'message': f'Database {self.db_name} accessible',
-                    'databases': databases
-                }
-                print(f"    {Colors.GREEN}✓ Database {self.db_name} accessible{Colors.RESET}")
+                    'message': 'Health endpoint responding',
+                    'http_status': status_code,
+                    'response': content.strip()
+                })
+                self._ok(f"Health endpoint OK ({status_code})")
             else:
-                self._mark_unhealthy(check_name,
-                                     f'Database {self.db_name} not found. Available: {databases}')
-                print(f"    {Colors.RED}✗ Database {self.db_name} not found{Colors.RESET}")
+                self._mark_unhealthy(check_name, f'HTTP {status_code}: {content}')
+                self._fail(f"Health endpoint returned {status_code}")
 
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Database connectivity failed: {str(e)}')
-            print(f"    {Colors.RED}✗ Database connectivity failed: {e}{Colors.RESET}")
-        finally:
-            socket.setdefaulttimeout(None)
+        except OSError as e:
+            self._mark_unhealthy(check_name, f'Connection error: {e}')
+            self._fail(f"Health endpoint unreachable: {e}")
 
-    def _check_odoo_responsiveness(self):
-        """Check 4: Odoo server responsiveness (authentication test)"""
-        check_name = "odoo_responsiveness"
-        print(f"  → Checking Odoo server responsiveness...")
+    @healthcheck('database_connectivity', 'Checking database connectivity', 'Database connectivity failed')
+    def _check_database_connectivity(self, check_name):
+        """Check 3: Database connectivity via JSON-RPC"""
+        # Test database list endpoint (doesn't require auth)
+        databases = self._jsonrpc('db', 'list', [])
 
-        try:
-            common_url = f"{self.base_url}/xmlrpc/2/common"
-            common = xmlrpc.client.ServerProxy(common_url, allow_none=True)
-
-            # Test authentication
-            socket.setdefaulttimeout(self.timeout)
-            start_time = time.time()
-            uid = common.authenticate(self.db_name, self.username, self.password, {})
-            auth_time = time.time() - start_time
-
-            if uid:
-                self.results['checks'][check_name] = {
-                    'status': 'healthy',
-                    'message': 'Authentication successful',
-                    'user_id': uid,
-                    'auth_time_seconds': round(auth_time, 3)
-                }
-                print(f"    {Colors.GREEN}✓ Authentication successful (uid={uid}, {auth_time:.3f}s){Colors.RESET}")
-            else:
-                self._mark_unhealthy(check_name, 'Authentication failed (invalid credentials)')
-                print(f"    {Colors.RED}✗ Authentication failed{Colors.RESET}")
+        if self.db_name in databases:
+            self._record_check(check_name, {
+                'status': 'healthy',
+                'message': f'Database {self.db_name} accessible',
+                'databases': databases
+            })
+            self._ok(f"Database {self.db_name} accessible")
+        else:
+            self._mark_unhealthy(check_name,
+                                 f'Database {self.db_name} not found. Available: {databases}')
+            self._fail(f"Database {self.db_name} not found")
 
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Odoo server not responding: {str(e)}')
-            print(f"    {Colors.RED}✗ Odoo server not responding: {e}{Colors.RESET}")
-        finally:
-            socket.setdefaulttimeout(None)
+    @healthcheck('odoo_responsiveness', 'Checking Odoo server responsiveness', 'Odoo server not responding')
+    def _check_odoo_responsiveness(self, check_name):
+        """Check 4: Odoo server responsiveness (authentication test)"""
+        # Test authentication
+        start_time = time.perf_counter()
+        uid = self._authenticate()
+        auth_time = time.perf_counter() - start_time
+
+        if uid:
+            with self._auth_lock:
+                if self._uid is None:
+                    self._uid = uid
+            self._record_check(check_name, {
+                'status': 'healthy',
+                'message': 'Authentication successful',
+                'user_id': uid,
+                'auth_time_seconds': round(auth_time, 3)
+            })
+            self._ok(f"Authentication successful (uid={uid}, {auth_time:.3f}s)")
+        else:
+            self._mark_unhealthy(check_name, 'Authentication failed (invalid credentials)')
+            self._fail("Authentication failed")
 
-    def _check_module_loading(self):
+    @ttl_cached('module_loading', seconds=60)
+    @healthcheck('module_loading', 'Checking module loading status', 'Module check failed')
+    def _check_module_loading(self, check_name):
         """Check 5: Verify all modules loaded successfully"""
-        check_name = "module_loading"
-        print(f"  → Checking module loading status...")
-
-        try:
-            # Authenticate
-            common = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/common")
-            uid = common.authenticate(self.db_name, self.username, self.password, {})
-
-            if not uid:
-                self._mark_unhealthy(check_name, 'Authentication failed')
-                return
-
-            # Get module status
-            models = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/object")
-            socket.setdefaulttimeout(self.timeout)
-
-            installed_modules = models.execute_kw(
-                self.db_name, uid, self.password,
-                'ir.module.module', 'search_read',
-                [[('state', '=', 'installed')]],
-                {'fields': ['name', 'state']}
-            )
-
-            to_upgrade_modules = models.execute_kw(
-                self.db_name, uid, self.password,
-                'ir.module.module', 'search_count',
-                [[('state', '=', 'to upgrade')]]
-            )
-
-            to_install_modules = models.execute_kw(
-                self.db_name, uid, self.password,
-                'ir.module.module', 'search_count',
-                [[('state', '=', 'to install')]]
-            )
-
-            if to_upgrade_modules > 0 or to_install_modules > 0:
-                self._mark_unhealthy(check_name,
-                                     f'{to_upgrade_modules} modules to upgrade, {to_install_modules} to install')
-                print(f"    {Colors.YELLOW}⚠ Pending module operations detected{Colors.RESET}")
-            else:
-                self.results['checks'][check_name] = {
-                    'status': 'healthy',
-                    'message': f'{len(installed_modules)} modules installed',
-                    'installed_count': len(installed_modules)
-                }
-                print(f"    {Colors.GREEN}✓ All modules loaded ({len(installed_modules)} installed){Colors.RESET}")
-
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Module check failed: {str(e)}')
-            print(f"    {Colors.RED}✗ Module check failed: {e}{Colors.RESET}")
-        finally:
-            socket.setdefaulttimeout(None)
-
-    def _check_filestore_access(self):
-        """Check 6: Verify filestore is accessible"""
-        check_name = "filestore_access"
-        print(f"  → Checking filestore access...")
-
-        try:
-            # Authenticate
-            common = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/common")
-            uid = common.authenticate(self.db_name, self.username, self.password, {})
-
-            if not uid:
-                self._mark_unhealthy(check_name, 'Authentication failed')
-                return
-
-            # Check attachments (filestore proxy)
-            models = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/object")
-            socket.setdefaulttimeout(self.timeout)
-
-            attachment_count = models.execute_kw(
-                self.db_name, uid, self.password,
-                'ir.attachment', 'search_count',
-                [[('type', '=', 'binary')]]
-            )
-
-            self.results['checks'][check_name] = {
+        uid = self._ensure_authenticated()
+        if not uid:
+            self._mark_unhealthy(check_name, 'Authentication failed')
+            return
+
+        # Count modules per state in a single aggregate query
+        groups = self._execute_kw(
+            uid, 'ir.module.module', 'read_group',
+            [[], ['state'], ['state']],
+            {'lazy': False}
+        )
+        counts = {group['state']: group['__count'] for group in groups}
+        installed_count = counts.get('installed', 0)
+        to_upgrade_modules = counts.get('to upgrade', 0)
+        to_install_modules = counts.get('to install', 0)
+
+        if to_upgrade_modules > 0 or to_install_modules > 0:
+            self._mark_unhealthy(check_name,
+                                 f'{to_upgrade_modules} modules to upgrade, {to_install_modules} to install')
+            self._warn("Pending module operations detected")
+        else:
+            self._record_check(check_name, {
                 'status': 'healthy',
-                'message': f'Filestore accessible ({attachment_count} binary attachments)',
-                'attachment_count': attachment_count
-            }
-            print(f"    {Colors.GREEN}✓ Filestore accessible ({attachment_count} attachments){Colors.RESET}")
-
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Filestore check failed: {str(e)}')
-            print(f"    {Colors.RED}✗ Filestore check failed: {e}{Colors.RESET}")
-        finally:
-            socket.setdefaulttimeout(None)
+                'message': f'{installed_count} modules installed',
+                'installed_count': installed_count
+            })
+            self._ok(f"All modules loaded ({installed_count} installed)")
+
+    @ttl_cached('filestore_access', seconds=30)
+    @healthcheck('filestore_access', 'Checking filestore access', 'Filestore check failed')
+    def _check_filestore_access(self, check_name):
+        """Check 6: Verify filestore is accessible"""
+        uid = self._ensure_authenticated()
+        if not uid:
+            self._mark_unhealthy(check_name, 'Authentication failed')
+            return
+
+        # Check attachments (filestore proxy)
+        attachment_count = self._execute_kw(
+            uid, 'ir.attachment', 'search_count',
+            [[('type', '=', 'binary')]]
+        )
+
+        self._record_check(check_name, {
+            'status': 'healthy',
+            'message': f'Filestore accessible ({attachment_count} binary attachments)',
+            'attachment_count': attachment_count
+        })
+        self._ok(f"Filestore accessible ({attachment_count} attachments)")
 
-    def _check_response_time(self):
+    @healthcheck('response_time', 'Measuring response time', 'Response time check failed')
+    def _check_response_time(self, check_name):
         """Check 7: Measure and validate response time"""
-        check_name = "response_time"
-        print(f"  → Measuring response time...")
-
-        try:
-            # Sample 5 requests to /web/health
-            response_times = []
-            for i in range(5):
-                start_time = time.time()
-                req = Request(f"{self.base_url}/web/health")
-                with urlopen(req, timeout=self.timeout) as response:
-                    response.read()
-                response_times.append(time.time() - start_time)
-
-            avg_response_time = sum(response_times) / len(response_times)
-            p95_response_time = sorted(response_times)[int(len(response_times) * 0.95)]
-
-            # Threshold: P95 should be under 500ms
-            if p95_response_time < 0.5:
-                self.results['checks'][check_name] = {
-                    'status': 'healthy',
-                    'message': 'Response time within SLA',
-                    'avg_ms': round(avg_response_time * 1000, 2),
-                    'p95_ms': round(p95_response_time * 1000, 2)
-                }
-                print(f"    {Colors.GREEN}✓ Response time OK (avg={avg_response_time*1000:.0f}ms, p95={p95_response_time*1000:.0f}ms){Colors.RESET}")
-            else:
-                self._mark_unhealthy(check_name,
-                                     f'Response time too high (p95={p95_response_time*1000:.0f}ms)')
-                print(f"    {Colors.YELLOW}⚠ Response time high (p95={p95_response_time*1000:.0f}ms){Colors.RESET}")
-
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Response time check failed: {str(e)}')
-            print(f"    {Colors.RED}✗ Response time check failed: {e}{Colors.RESET}")
-
-    def _check_critical_workflows(self):
-        """Check 8: Critical workflow smoke tests"""
-        check_name = "critical_workflows"
-        print(f"  → Running critical workflow smoke tests...")
-
-        try:
-            # Authenticate
-            common = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/common")
-            uid = common.authenticate(self.db_name, self.username, self.password, {})
-
-            if not uid:
-                self._mark_unhealthy(check_name, 'Authentication failed')
-                return
-
-            models = xmlrpc.client.ServerProxy(f"{self.base_url}/xmlrpc/2/object")
-            socket.setdefaulttimeout(self.timeout)
-
-            # Test 1: Create partner record
-            partner_id = models.execute_kw(
-                self.db_name, uid, self.password,
-                'res.partner', 'create',
-                [{'name': 'Health Check Test Partner',
-                  'email': 'healthcheck@example.com'}]
-            )
-
-            # Test 2: Search for created record
-            found_partners = models.execute_kw(
-                self.db_name, uid, self.password,
-                'res.partner', 'search',
-                [[('id', '=', partner_id)]]
-            )
-
-            # Test 3: Update record
-            models.execute_kw(
-                self.db_name, uid, self.password,
-                'res.partner', 'write',
-                [[partner_id], {'phone': '+1234567890'}]
-            )
-
-            # Test 4: Delete record (cleanup)
-            models.execute_kw(
-                self.db_name, uid, self.password,
-                'res.partner', 'unlink',
-                [[partner_id]]
-            )
-
-            if partner_id and found_partners:
-                self.results['checks'][check_name] = {
-                    'status': 'healthy',
-                    'message': 'CRUD operations successful',
-                    'tests_passed': ['create', 'read', 'update', 'delete']
-                }
-                print(f"    {Colors.GREEN}✓ Critical workflows OK (CRUD operations successful){Colors.RESET}")
-            else:
-                self._mark_unhealthy(check_name, 'CRUD operations failed')
-                print(f"    {Colors.RED}✗ CRUD operations failed{Colors.RESET}")
-
-        except Exception as e:
-            self._mark_unhealthy(check_name, f'Workflow tests failed: {str(e)}')
-            print(f"    {Colors.RED}✗ Workflow tests failed: {e}{Colors.RESET}")
-        finally:
-            socket.setdefaulttimeout(None)
+        # Sample concurrent requests to /web/health, as real clients would
+        samples = self.RESPONSE_TIME_SAMPLES
+        with ThreadPoolExecutor(max_workers=samples) as executor:
+            response_times = list(executor.map(self._timed_health_probe, range(samples)))
+
+        avg_response_time = sum(response_times) / len(response_times)
+        # Nearest-rank percentile: the ceil(0.95n)-th smallest sample is
+        # the (n - ceil(0.95n) + 1)-th largest, so only keep the top k
+        n = len(response_times)
+        k = n - math.ceil(n * 0.95) + 1
+        p95_response_time = heapq.nlargest(k, response_times)[-1]
+
+        # Threshold: P95 should be under 500ms
+        if p95_response_time < 0.5:
+            self._record_check(check_name, {
+                'status': 'healthy',
+                'message': 'Response time within SLA',
+                'avg_ms': round(avg_response_time * 1000, 2),
+                'p95_ms': round(p95_response_time * 1000, 2)
+            })
+            self._ok(f"Response time OK (avg={avg_response_time*1000:.0f}ms, p95={p95_response_time*1000:.0f}ms)")
+        else:
+            self._mark_unhealthy(check_name,
+                                 f'Response time too high (p95={p95_response_time*1000:.0f}ms)')
+            self._warn(f"Response time high (p95={p95_response_time*1000:.0f}ms)")
+
+    def _timed_health_probe(self, _sample=None) -> float:
+        """Request /web/health once and return the elapsed seconds"""
+        start_time = time.perf_counter()
+        status_code, _body = self._http.request(
+            'GET', '/web/health', headers={'User-Agent': 'HealthChecker/1.0'})
+        elapsed = time.perf_counter() - start_time
+        if status_code != 200:
+            raise RuntimeError(f'/web/health returned HTTP {status_code}')
+        return elapsed
+
+    @healthcheck('workflow_smoke', 'Running workflow smoke read', 'Workflow smoke read failed')
+    def _check_workflow_smoke(self, check_name):
+        """Check 8: Read-only ORM round trip (default workflow smoke test)"""
+        uid = self._ensure_authenticated()
+        if not uid:
+            self._mark_unhealthy(check_name, 'Authentication failed')
+            return
+
+        # Exercises auth, ORM and database without writing anything
+        users = self._execute_kw(
+            uid, 'res.users', 'read',
+            [[uid], ['login']]
+        )
+
+        if users:
+            self._record_check(check_name, {
+                'status': 'healthy',
+                'message': 'ORM read successful',
+                'login': users[0]['login']
+            })
+            self._ok("Workflow smoke read OK (res.users)")
+        else:
+            self._mark_unhealthy(check_name, f'User {uid} could not be read')
+            self._fail("Workflow smoke read returned no user")
+
+    @healthcheck('critical_workflows', 'Running critical workflow smoke tests', 'Workflow tests failed')
+    def _check_critical_workflows(self, check_name):
+        """Check 8 (--deep-workflow): Critical workflow CRUD tests"""
+        uid = self._ensure_authenticated()
+        if not uid:
+            self._mark_unhealthy(check_name, 'Authentication failed')
+            return
+
+        # Test 1: Create partner record
+        partner_id = self._execute_kw(
+            uid, 'res.partner', 'create',
+            [{'name': 'Health Check Test Partner',
+              'email': 'healthcheck@example.com'}]
+        )
+
+        # Test 2: Search for created record
+        found_partners = self._execute_kw(
+            uid, 'res.partner', 'search',
+            [[('id', '=', partner_id)]]
+        )
+
+        # Test 3: Update record
+        self._execute_kw(
+            uid, 'res.partner', 'write',
+            [[partner_id], {'phone': '+1234567890'}]
+        )
+
+        # Test 4: Delete record (cleanup)
+        self._execute_kw(
+            uid, 'res.partner', 'unlink',
+            [[partner_id]]
+        )
+
+        if partner_id and found_partners:
+            self._record_check(check_name, {
+                'status': 'healthy',
+                'message': 'CRUD operations successful',
+                'tests_passed': ['create', 'read', 'update', 'delete']
+            })
+            self._ok("Critical workflows OK (CRUD operations successful)")
+        else:
+            self._mark_unhealthy(check_name, 'CRUD operations failed')
+            self._fail("CRUD operations failed")
+
+    def _ensure_authenticated(self):
+        """Log in once and return the uid shared by all checks (falsy on failure)
+
+        A login that raised is remembered for the run: the other checks
+        re-raise it at once instead of each retrying (and timing out) in turn.
+        """
+        with self._auth_lock:
+            if self._auth_error is not None:
+                raise self._auth_error
+            if self._uid is None:
+                try:
+                    self._uid = self._authenticate()
+                except Exception as e:
+                    self._auth_error = e
+                    raise
+            return self._uid
+
+    def _authenticate(self):
+        """Log in and return the uid (falsy on invalid credentials)"""
+        return self._jsonrpc('common', 'authenticate',
+                             [self.db_name, self.username, self.password, {}])
+
+    def _execute_kw(self, uid, model: str, method: str, args: List, kwargs: Dict = None):
+        """Call a model method through the object service"""
+        return self._jsonrpc('object', 'execute_kw',
+                             [self.db_name, uid, self.password, model, method, args, kwargs or {}])
+
+    def _jsonrpc(self, service: str, method: str, args: List):
+        """Call an Odoo service over /jsonrpc on a pooled connection"""
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {'service': service, 'method': method, 'args': args},
+            'id': next(self._rpc_ids),
+        }
+        status_code, body = self._http.request(
+            'POST', '/jsonrpc', body=json_dumps(payload),
+            headers={'Content-Type': 'application/json', 'User-Agent': 'HealthChecker/1.0'})
+        if status_code != 200:
+            raise RPCError(f'HTTP {status_code} from /jsonrpc')
+        response = json_loads(body)
+        if 'error' in response:
+            error = response['error']
+            raise RPCError(error.get('data', {}).get('message') or error.get('message'))
+        return response['result']
+
+    def _log(self, message: str):
+        """Print one line, unless running quietly (JSON output only)"""
+        if self._quiet:
+            return
+        with self._print_lock:
+            print(message)
+
+    def _progress(self, message: str):
+        """Report check progress; dropped once the run's deadline has passed"""
+        if not self._closed.is_set():
+            self._log(message)
+
+    def _ok(self, message: str):
+        self._progress(f"    {Colors.GREEN}✓ {message}{Colors.RESET}")
+
+    def _fail(self, message: str):
+        self._progress(f"    {Colors.RED}✗ {message}{Colors.RESET}")
+
+    def _warn(self, message: str):
+        self._progress(f"    {Colors.YELLOW}⚠ {message}{Colors.RESET}")
+
+    def _record_check(self, check_name: str, result: Dict):
+        """Store the result of a check (called from worker threads)"""
+        with self._lock:
+            if not self._closed.is_set():
+                self.results['checks'][check_name] = result
 
     def _mark_unhealthy(self, check_name: str, message: str):
         """Mark a check as unhealthy and update overall status"""
-        self.results['status'] = 'unhealthy'
-        self.results['checks'][check_name] = {
-            'status': 'unhealthy',
-            'message': message
-        }
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self.results['status'] = 'unhealthy'
+            self.results['checks'][check_name] = {
+                'status': 'unhealthy',
+                'message': message
+            }
 
     def _print_summary(self):
         """Print health check summary"""
-        print(f"\n{'='*60}")
-        print(f"{Colors.BLUE}Health Check Summary{Colors.RESET}")
-        print(f"{'='*60}")
+        self._log(f"\n{'='*60}")
+        self._log(f"{Colors.BLUE}Health Check Summary{Colors.RESET}")
+        self._log(f"{'='*60}")
 
         total_checks = len(self.results['checks'])
         healthy_checks = sum(1 for c in self.results['checks'].values()
@@ -427,11 +628,11 @@ class HealthChecker:
             status_color = Colors.RED
             status_icon = '✗'
 
-        print(f"Overall Status: {status_color}{status_icon} {self.results['status'].upper()}{Colors.RESET}")
-        print(f"Total Checks: {total_checks}")
-        print(f"Passed: {Colors.GREEN}{healthy_checks}{Colors.RESET}")
-        print(f"Failed: {Colors.RED}{unhealthy_checks}{Colors.RESET}")
-        print(f"{'='*60}\n")
+        self._log(f"Overall Status: {status_color}{status_icon} {self.results['status'].upper()}{Colors.RESET}")
+        self._log(f"Total Checks: {total_checks}")
+        self._log(f"Passed: {Colors.GREEN}{healthy_checks}{Colors.RESET}")
+        self._log(f"Failed: {Colors.RED}{unhealthy_checks}{Colors.RESET}")
+        self._log(f"{'='*60}\n")
 
 
 def main():
@@ -455,11 +656,19 @@ def main():
                         help='Request timeout in seconds (default: 30)')
     parser.add_argument('--comprehensive', action='store_true',
                         help='Run comprehensive health checks (slower)')
+    parser.add_argument('--deep-workflow', action='store_true',
+                        help='With --comprehensive, run the create/write/unlink workflow test '
+                             'instead of the read-only smoke check (writes to the database)')
+    parser.add_argument('--fast', action='store_true',
+                        help='Only check the /web/health endpoint (for frequent readiness probes)')
     parser.add_argument('--json', action='store_true',
                         help='Output results as JSON')
 
     args = parser.parse_args()
 
+    if args.fast and args.comprehensive:
+        parser.error('--fast cannot be combined with --comprehensive')
+
     # Auto-detect URL from target
     if args.target:
         if args.target == 'blue':
@@ -474,14 +683,19 @@ def main():
         username=args.username,
         password=args.password,
         timeout=args.timeout,
-        comprehensive=args.comprehensive
+        comprehensive=args.comprehensive,
+        deep_workflow=args.deep_workflow,
+        fast=args.fast,
+        quiet=args.json
     )
 
     results = checker.run_all_checks()
 
     # Output results
     if args.json:
-        print(json.dumps(results, indent=2))
+        # Write the encoded bytes directly, skipping the text layer
+        sys.stdout.buffer.write(json_dumps_pretty(results) + b"\n")
+        sys.stdout.buffer.flush()
 
     # Exit with appropriate code
     if results['status'] == 'healthy':
@@ -75,6 +75,23 @@ RECORDS_TO_DELETE = [
     # ('my_module', 'deprecated_view'),
 ]
 
+# Reverse of FIELD_RENAMES / MODEL_RENAMES, used by the rollback functions
+FIELD_ROLLBACKS = {
+    model: [(new_field, old_field) for old_field, new_field in renames]
+    for model, renames in FIELD_RENAMES.items()
+}
+MODEL_ROLLBACKS = [(new_model, old_model) for old_model, new_model in MODEL_RENAMES]
+
+# get_migration_stats(stats_mode='approx') only samples tables at least this big
+APPROX_STATS_MIN_ROWS = 100000
+
+# Session settings for the migration transaction, see tune_migration_session()
+MIGRATION_SESSION_SETTINGS = {
+    'synchronous_commit': 'off',
+    'work_mem': '256MB',
+    'maintenance_work_mem': '2GB',
+}
+
 
 # ==============================================================================
 # PRE-MIGRATION FUNCTIONS
@@ -155,19 +172,33 @@ def pre_migration_handle_dependencies(cr):
     """
     _logger.info("Checking module dependencies...")
 
-    # Example: Check if required module is installed
     required_modules = ['hr', 'account']
-    for module in required_modules:
-        if not openupgrade.is_module_installed(cr, module):
-            raise Exception(
-                f"Required module '{module}' is not installed. "
-                f"Install it before running migration."
-            )
+    optional_modules = ['hr_expense_analytic', 'project']
+
+    # Fetch the state of every module in one query, with the same notion of
+    # "installed" as openupgrade.is_module_installed()
+    cr.execute(
+        """
+        SELECT name
+        FROM ir_module_module
+        WHERE name = ANY(%s)
+        AND state IN ('installed', 'to upgrade')
+        """,
+        (required_modules + optional_modules,)
+    )
+    installed = {row[0] for row in cr.fetchall()}
+
+    # Example: Check if required modules are installed
+    missing_required = [m for m in required_modules if m not in installed]
+    if missing_required:
+        raise Exception(
+            f"Required module(s) {', '.join(missing_required)} not installed. "
+            f"Install them before running migration."
+        )
 
     # Example: Check optional modules
-    optional_modules = ['hr_expense_analytic', 'project']
     for module in optional_modules:
-        if not openupgrade.is_module_installed(cr, module):
+        if module not in installed:
             _logger.warning(
                 f"Optional module '{module}' not installed. "
                 f"Some migration features will be skipped."
@@ -187,35 +218,53 @@ def pre_migration_schema_changes(cr):
     """
     _logger.info("Applying schema changes...")
 
+    # Collect the changes first and send them in a single round trip: one
+    # ALTER TABLE per table (a single ACCESS EXCLUSIVE lock) followed by
+    # the data copies that depend on the new columns.
+    alterations = []
+    updates = []
+    done = []
+
+    # Load the table's columns once instead of one lookup per column
+    cr.execute(
+        """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = current_schema()
+        AND table_name = %s
+        """,
+        ('expense_report',)
+    )
+    columns = {row[0] for row in cr.fetchall()}
+
     # Example: Add new required column with default
-    if not openupgrade.column_exists(cr, 'expense_report', 'status'):
-        openupgrade.logged_query(
-            cr,
-            """
-            ALTER TABLE expense_report
-            ADD COLUMN status VARCHAR(50) DEFAULT 'draft'
-            """
-        )
-        _logger.info("✅ Added expense_report.status column")
+    if 'status' not in columns:
+        alterations.append("ADD COLUMN status VARCHAR(50) DEFAULT 'draft'")
+        done.append("Added expense_report.status column")
 
     # Example: Change column type (via copy)
-    if openupgrade.column_exists(cr, 'expense_report', 'old_amount'):
-        openupgrade.logged_query(
-            cr,
-            """
-            ALTER TABLE expense_report
-            ADD COLUMN amount_new NUMERIC(12, 2)
-            """
-        )
-        openupgrade.logged_query(
-            cr,
+    if 'old_amount' in columns:
+        alterations.append("ADD COLUMN amount_new NUMERIC(12, 2)")
+        updates.append(
             """
             UPDATE expense_report
             SET amount_new = old_amount::NUMERIC
             WHERE old_amount IS NOT NULL
             """
         )
-        _logger.info("✅ Converted expense_report.amount to NUMERIC")
+        done.append("Converted expense_report.amount to NUMERIC")
+
+    statements = []
+    if alterations:
+        statements.append(
+            "ALTER TABLE expense_report\n" + ",\n".join(alterations)
+        )
+    statements.extend(updates)
+
+    if statements:
+        openupgrade.logged_query(cr, ";\n".join(statements))
+        for message in done:
+            _logger.info(f"✅ {message}")
 
 
 @openupgrade.migrate()
@@ -239,6 +288,8 @@ def migrate(env, version):
     _logger.info(f"Starting PRE-migration: {SOURCE_VERSION} → {TARGET_VERSION}")
     _logger.info("="*80)
 
+    tune_migration_session(cr)
+
     # Step 1: Check dependencies
     pre_migration_handle_dependencies(cr)
 
@@ -321,17 +372,25 @@ def post_migration_transform_data(env):
         # 'draft' stays the same
     }
 
-    for old_value, new_value in status_mapping.items():
+    # One pass over the table for every mapping: rows whose status is not
+    # being remapped are not touched (no dead tuples, no index writes)
+    mapping = [(old, new) for old, new in status_mapping.items() if old != new]
+    if mapping:
+        cases = " ".join("WHEN %s THEN %s" for _ in mapping)
+        params = [value for pair in mapping for value in pair]
         openupgrade.logged_query(
             cr,
-            """
+            f"""
             UPDATE hr_expense_sheet
-            SET status = %s
-            WHERE status = %s
+            SET status = CASE status {cases} END
+            WHERE status = ANY(%s)
             """,
-            (new_value, old_value)
+            (*params, [old for old, _ in mapping])
         )
 
+    # Refresh planner statistics for the joins and aggregates that follow
+    analyze_tables(cr, ['hr_expense_sheet'])
+
     _logger.info("✅ Status values transformed")
 
 
@@ -340,42 +399,58 @@ def post_migration_compute_fields(env):
     Recompute computed fields and trigger business logic.
 
     This function:
-    - Triggers @api.depends computed fields
     - Recalculates aggregated values
     - Ensures data consistency
 
-    Use ORM for this to properly trigger all decorators.
+    Plain aggregates are recomputed in SQL: one statement for the whole
+    table instead of loading and computing every record through the ORM.
+    Keep the ORM (recordset.recompute()) for fields with real business logic.
     """
+    cr = env.cr
     _logger.info("Computing fields...")
 
-    # Example: Recompute expense sheet totals
-    ExpenseSheet = env['hr.expense.sheet']
-
-    # Find sheets with missing computed values
-    sheets_to_compute = ExpenseSheet.search([
-        '|',
-        ('total_amount', '=', 0),
-        ('expense_count', '=', 0)
-    ])
-
-    _logger.info(f"Found {len(sheets_to_compute)} sheets to recompute")
-
-    # Process in batches
-    BATCH_SIZE = 1000
-    for i in range(0, len(sheets_to_compute), BATCH_SIZE):
-        batch = sheets_to_compute[i:i+BATCH_SIZE]
+    # Example: Recompute expense sheet totals from their expense lines
+    openupgrade.logged_query(
+        cr,
+        """
+        UPDATE hr_expense_sheet s
+        SET total_amount = t.total_amount,
+            expense_count = t.expense_count
+        FROM (
+            SELECT sheet_id,
+                   SUM(total_amount) AS total_amount,
+                   COUNT(*) AS expense_count
+            FROM hr_expense
+            WHERE sheet_id IS NOT NULL
+            GROUP BY sheet_id
+        ) t
+        WHERE s.id = t.sheet_id
+        AND (s.total_amount IS DISTINCT FROM t.total_amount
+             OR s.expense_count IS DISTINCT FROM t.expense_count)
+        """
+    )
 
-        for sheet in batch:
-            sheet._compute_total_amount()
-            sheet._compute_expense_count()
+    # Sheets without any expense line
+    openupgrade.logged_query(
+        cr,
+        """
+        UPDATE hr_expense_sheet s
+        SET total_amount = 0,
+            expense_count = 0
+        WHERE NOT EXISTS (
+            SELECT 1 FROM hr_expense e WHERE e.sheet_id = s.id
+        )
+        AND (s.total_amount IS DISTINCT FROM 0
+             OR s.expense_count IS DISTINCT FROM 0)
+        """
+    )
 
-        # Commit each batch
-        env.cr.commit()
+    # Refresh planner statistics for the validation queries
+    analyze_tables(cr, ['hr_expense_sheet', 'hr_expense'])
 
-        _logger.info(
-            f"Processed batch {i//BATCH_SIZE + 1} "
-            f"({min(i+BATCH_SIZE, len(sheets_to_compute))}/{len(sheets_to_compute)})"
-        )
+    # The ORM cache no longer matches the rows updated above
+    env.invalidate_all()
+    env.cr.commit()
 
     _logger.info("✅ Field computation completed")
 
@@ -395,45 +470,52 @@ def post_migration_data_validation(env):
     cr = env.cr
     _logger.info("Validating migrated data...")
 
-    # Example: Check for NULL values in required fields
+    # Example: Check for NULL values in required fields. Stop at the first
+    # offending row and only count them all when reporting the failure.
     cr.execute(
         """
-        SELECT COUNT(*)
+        SELECT 1
         FROM hr_expense_sheet
         WHERE status IS NULL
+        LIMIT 1
         """
     )
 
-    null_count = cr.fetchone()[0]
-
-    if null_count > 0:
+    if cr.fetchone():
+        cr.execute(
+            """
+            SELECT COUNT(*)
+            FROM hr_expense_sheet
+            WHERE status IS NULL
+            """
+        )
+        null_count = cr.fetchone()[0]
         raise ValueError(
             f"❌ Migration validation failed: "
             f"{null_count} records have NULL status"
         )
 
-    # Example: Verify totals match line items
-    cr.execute(
+    # Example: Verify totals match line items, fixing mismatches in place
+    fixed = openupgrade.logged_query(
+        cr,
         """
-        SELECT s.id, s.total_amount, SUM(e.total_amount) as computed_total
-        FROM hr_expense_sheet s
-        LEFT JOIN hr_expense e ON e.sheet_id = s.id
-        GROUP BY s.id, s.total_amount
-        HAVING ABS(s.total_amount - COALESCE(SUM(e.total_amount), 0)) > 0.01
+        WITH bad AS (
+            SELECT s.id, COALESCE(SUM(e.total_amount), 0) AS computed_total
+            FROM hr_expense_sheet s
+            LEFT JOIN hr_expense e ON e.sheet_id = s.id
+            GROUP BY s.id, s.total_amount
+            HAVING ABS(s.total_amount - COALESCE(SUM(e.total_amount), 0)) > 0.01
+        )
+        UPDATE hr_expense_sheet
+        SET total_amount = bad.computed_total
+        FROM bad
+        WHERE hr_expense_sheet.id = bad.id
         """
     )
 
-    mismatched = cr.fetchall()
-
-    if mismatched:
-        _logger.warning(
-            f"Found {len(mismatched)} sheets with mismatched totals. "
-            f"Will recompute..."
-        )
-        # Auto-fix by recomputing
-        for sheet_id, _, _ in mismatched:
-            sheet = env['hr.expense.sheet'].browse(sheet_id)
-            sheet._compute_total_amount()
+    if fixed:
+        env.invalidate_all()
+        _logger.warning(f"Recomputed {fixed} sheets with mismatched totals")
 
     _logger.info("✅ Data validation passed")
 
@@ -457,13 +539,13 @@ def post_migration_cleanup(env):
         f'migration_{MODULE_NAME}_mapping',
     ]
 
-    for table in backup_tables:
-        if openupgrade.table_exists(cr, table):
-            openupgrade.logged_query(
-                cr,
-                f"DROP TABLE IF EXISTS {table} CASCADE"
-            )
-            _logger.info(f"✅ Dropped {table}")
+    # A single DROP for all of them; the tables are migration-private, so
+    # there is nothing to CASCADE to and no dependency walk to pay for
+    openupgrade.logged_query(
+        cr,
+        f"DROP TABLE IF EXISTS {', '.join(backup_tables)}"
+    )
+    _logger.info(f"✅ Dropped {', '.join(backup_tables)}")
 
     # Drop temporary columns
     if openupgrade.column_exists(cr, 'hr_expense_sheet', 'old_amount'):
@@ -513,7 +595,7 @@ def post_migration_update_sequences(env):
 #
 #     Execution order:
 #     1. Transform data to new schema
-#     2. Compute fields with ORM
+#     2. Recompute aggregated fields
 #     3. Update sequences
 #     4. Validate data integrity
 #     5. Clean up migration artifacts
@@ -524,11 +606,14 @@ def post_migration_update_sequences(env):
 #     _logger.info(f"Starting POST-migration: {SOURCE_VERSION} → {TARGET_VERSION}")
 #     _logger.info("="*80)
 #
+#     tune_migration_session(env.cr)
+#
 #     # Step 1: Transform data
 #     post_migration_transform_data(env)
 #
-#     # Step 2: Compute fields
+#     # Step 2: Compute fields (commits, which resets the session settings)
 #     post_migration_compute_fields(env)
+#     tune_migration_session(env.cr)
 #
 #     # Step 3: Update sequences
 #     post_migration_update_sequences(env)
@@ -550,30 +635,15 @@ def post_migration_update_sequences(env):
 
 def rollback_field_renames(env):
     """Reverse field renames to restore original names"""
-    # Reverse the FIELD_RENAMES mapping
-    field_rollbacks = {}
-
-    for model, renames in FIELD_RENAMES.items():
-        field_rollbacks[model] = [
-            (new_field, old_field)  # Swap order
-            for old_field, new_field in renames
-        ]
-
-    if field_rollbacks:
-        openupgrade.rename_fields(env, field_rollbacks)
+    if FIELD_ROLLBACKS:
+        openupgrade.rename_fields(env, FIELD_ROLLBACKS)
         _logger.info("✅ Field names restored")
 
 
 def rollback_model_renames(cr):
     """Reverse model renames to restore original names"""
-    # Reverse the MODEL_RENAMES list
-    model_rollbacks = [
-        (new_model, old_model)  # Swap order
-        for old_model, new_model in MODEL_RENAMES
-    ]
-
-    if model_rollbacks:
-        openupgrade.rename_models(cr, model_rollbacks)
+    if MODEL_ROLLBACKS:
+        openupgrade.rename_models(cr, MODEL_ROLLBACKS)
         _logger.info("✅ Model names restored")
 
 
@@ -589,6 +659,8 @@ def rollback_restore_backup_data(cr):
                 deprecated_column = b.deprecated_column
             FROM expense_report_backup b
             WHERE e.id = b.id
+            AND (e.old_field IS DISTINCT FROM b.old_field
+                 OR e.deprecated_column IS DISTINCT FROM b.deprecated_column)
             """
         )
         _logger.info("✅ Backup data restored")
@@ -623,24 +695,81 @@ def rollback_restore_backup_data(cr):
 # UTILITY FUNCTIONS
 # ==============================================================================
 
-def get_migration_stats(cr):
+def tune_migration_session(cr):
+    """
+    Apply MIGRATION_SESSION_SETTINGS to the current transaction.
+
+    Bulk UPDATEs and index builds get more sort memory, and commits stop
+    waiting for the WAL flush. This is safe for migrations: a crash
+    half-way requires restarting from the pre-migration backup anyway.
+    The settings are transaction-local, so re-apply after any commit.
+    """
+    names = list(MIGRATION_SESSION_SETTINGS)
+    cr.execute(
+        "SELECT " + ", ".join("set_config(%s, %s, true)" for _ in names),
+        [arg for name in names for arg in (name, MIGRATION_SESSION_SETTINGS[name])]
+    )
+
+
+def analyze_tables(cr, tables):
+    """
+    Refresh planner statistics after bulk changes.
+
+    Without it the planner keeps using pre-migration estimates and may
+    pick sequential scans for the queries of the following steps.
+    """
+    openupgrade.logged_query(cr, f"ANALYZE {', '.join(tables)}")
+
+
+def get_migration_stats(cr, stats_mode='exact'):
     """
     Get statistics about migration progress.
 
-    Useful for monitoring large migrations.
+    Useful for monitoring large migrations. With stats_mode='approx' the
+    status counts of large tables are estimated from the planner row count
+    and a 1% block sample instead of a full table scan.
     """
+    if stats_mode not in ('exact', 'approx'):
+        raise ValueError(f"Invalid stats_mode: {stats_mode}")
+
     stats = {}
 
-    # Example: Count records by status
-    cr.execute(
-        """
-        SELECT status, COUNT(*)
-        FROM hr_expense_sheet
-        GROUP BY status
-        """
-    )
+    estimated_total = 0
+    if stats_mode == 'approx':
+        cr.execute(
+            """
+            SELECT reltuples
+            FROM pg_class
+            WHERE oid = 'hr_expense_sheet'::regclass
+            """
+        )
+        estimated_total = cr.fetchone()[0]
 
-    stats['status_counts'] = dict(cr.fetchall())
+    # Example: Count records by status
+    if estimated_total >= APPROX_STATS_MIN_ROWS:
+        cr.execute(
+            """
+            SELECT status, COUNT(*)
+            FROM hr_expense_sheet TABLESAMPLE SYSTEM (1)
+            GROUP BY status
+            """
+        )
+        sample = dict(cr.fetchall())
+        sampled = sum(sample.values())
+        stats['status_counts'] = {
+            status: round(count / sampled * estimated_total)
+            for status, count in sample.items()
+        } if sampled else {}
+    else:
+        # Exact counts (small tables are cheap to scan even in approx mode)
+        cr.execute(
+            """
+            SELECT status, COUNT(*)
+            FROM hr_expense_sheet
+            GROUP BY status
+            """
+        )
+        stats['status_counts'] = dict(cr.fetchall())
 
     # Example: Check migration completion
     if openupgrade.table_exists(cr, f'migration_{MODULE_NAME}_mapping'):
@@ -25,29 +25,63 @@ import os
 import re
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
+    from jinja2 import (
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        select_autoescape,
+    )
 except ImportError:
     print("ERROR: jinja2 not installed. Run: pip install jinja2")
     sys.exit(1)
 
+BYTECODE_CACHE_DIR = Path.home() / '.cache' / 'new_module-jinja'
+
+# Field name patterns per Odoo field type, checked in order (first match wins).
+# Each list is compiled into a single alternation so a field name is scanned
+# once per type instead of once per pattern.
+FIELD_TYPE_PATTERNS = tuple(
+    (field_type, re.compile('|'.join(map(re.escape, patterns))))
+    for field_type, patterns in (
+        ('Char', ['name', 'code', 'reference', 'email', 'phone', 'url']),
+        ('Text', ['description', 'notes', 'comment', 'remarks']),
+        ('Integer', ['sequence', 'count', 'qty', 'quantity']),
+        ('Float', ['amount', 'price', 'rate', 'percentage', 'total']),
+        ('Boolean', ['active', 'is_', 'has_', 'can_']),
+        ('Date', ['date', '_date']),
+        ('Datetime', ['datetime', '_datetime', 'timestamp']),
+        ('Selection', ['state', 'status', 'type', 'stage']),
+        ('Many2one', ['_id']),
+    )
+)
+
 
 class OdooModuleGenerator:
     """Generate OCA-compliant Odoo modules"""
 
+    TEMPLATES = ('manifest.py.j2', 'model.py.j2', 'view.xml.j2', 'security.csv.j2')
+
     def __init__(self, template_dir: str = None, output_dir: str = None):
         self.template_dir = template_dir or self._get_template_dir()
         self.output_dir = output_dir or os.path.join(os.getcwd(), "custom_addons")
 
-        # Setup Jinja2 environment
+        # Setup Jinja2 environment, persisting compiled templates across runs
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self.env = Environment(
             loader=FileSystemLoader(self.template_dir),
+            bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR)),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        # Load every template once; renders then skip the loader entirely
+        self._templates = {name: self.env.get_template(name) for name in self.TEMPLATES}
+
+        # Rendered files waiting to be written, see _write()
+        self._pending_writes: List[Tuple[Path, str]] = []
 
     def _get_template_dir(self) -> str:
         """Find templates directory relative to script location"""
@@ -102,9 +136,7 @@ class OdooModuleGenerator:
             'summary': description.split('.')[0] if '.' in description else description,
         }
 
-        # Create module directory
         module_dir = Path(self.output_dir) / name
-        self._create_directory_structure(module_dir, parsed_models)
 
         # Generate files
         self._generate_manifest(module_dir, context)
@@ -115,6 +147,10 @@ class OdooModuleGenerator:
         self._generate_tests(module_dir, context)
         self._generate_readme(module_dir, context)
 
+        # Create module directory and write everything rendered above
+        self._create_directory_structure(module_dir, parsed_models)
+        self._flush_writes()
+
         print(f"✅ Module '{name}' generated successfully at: {module_dir}")
         print(f"\nNext steps:")
         print(f"  1. Review generated files in {module_dir}")
@@ -156,13 +192,26 @@ class OdooModuleGenerator:
                     'required': field_name in ['name'],
                 })
 
+            model_safe = model_name.replace('.', '_')
             parsed.append({
                 'model_name': model_name,
                 'class_name': class_name,
-                'model_safe': model_name.replace('.', '_'),
+                'model_safe': model_safe,
                 'description': f'{class_name} model',
                 'fields': fields,
-                'file_name': f'{model_name.replace(".", "_")}.py',
+                'file_name': f'{model_safe}.py',
+                # Derived once here for the view and manifest templates
+                'view_file': f'views/{model_safe}_views.xml',
+                'tree_fields': [{'name': f['name'], 'optional': False} for f in fields[:5]],
+                'search_fields': [{'name': f['name']} for f in fields[:3]],
+                'menu_items': [
+                    {
+                        'id': f"{model_safe}_root",
+                        'name': class_name,
+                        'action': f"action_{model_safe}",
+                        'sequence': 10,
+                    }
+                ],
             })
 
         return parsed
@@ -171,21 +220,8 @@ class OdooModuleGenerator:
         """Infer Odoo field type from field name"""
         field_name_lower = field_name.lower()
 
-        # Common patterns
-        type_patterns = {
-            'Char': ['name', 'code', 'reference', 'email', 'phone', 'url'],
-            'Text': ['description', 'notes', 'comment', 'remarks'],
-            'Integer': ['sequence', 'count', 'qty', 'quantity'],
-            'Float': ['amount', 'price', 'rate', 'percentage', 'total'],
-            'Boolean': ['active', 'is_', 'has_', 'can_'],
-            'Date': ['date', '_date'],
-            'Datetime': ['datetime', '_datetime', 'timestamp'],
-            'Selection': ['state', 'status', 'type', 'stage'],
-            'Many2one': ['_id'],
-        }
-
-        for field_type, patterns in type_patterns.items():
-            if any(pattern in field_name_lower for pattern in patterns):
+        for field_type, pattern in FIELD_TYPE_PATTERNS:
+            if pattern.search(field_name_lower):
                 return field_type
 
         # Default to Char
@@ -197,45 +233,65 @@ class OdooModuleGenerator:
 
     def _create_directory_structure(self, module_dir: Path, models: List[Dict]):
         """Create module directory structure"""
+        # Leaf directories only: mkdir(parents=True) creates module_dir and
+        # static/ on the way
         directories = [
-            module_dir,
             module_dir / 'models',
             module_dir / 'views',
             module_dir / 'security',
             module_dir / 'data',
             module_dir / 'tests',
-            module_dir / 'static',
             module_dir / 'static' / 'description',
         ]
 
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
 
+    def _write(self, path: Path, content: str):
+        """Queue a generated file, written by _flush_writes()"""
+        self._pending_writes.append((path, content))
+
+    def _flush_writes(self):
+        """Write all queued files in a single pass
+
+        Everything is rendered before the first file is written, so a
+        template error does not leave a half-generated module behind.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        for path, content in pending:
+            self._write_if_changed(path, content)
+
+    @staticmethod
+    def _write_if_changed(path: Path, content: str):
+        """Write content to path unless the file already holds exactly it"""
+        data = content.encode()
+        try:
+            if path.read_bytes() == data:
+                return
+        except FileNotFoundError:
+            pass
+        path.write_bytes(data)
+
     def _generate_manifest(self, module_dir: Path, context: Dict):
         """Generate __manifest__.py"""
-        template = self.env.get_template('manifest.py.j2')
-
-        # Prepare view files
-        view_files = []
-        for model in context.get('models', []):
-            view_files.append(f"views/{model['model_safe']}_views.xml")
+        template = self._templates['manifest.py.j2']
 
         context.update({
             'has_security': True,
-            'view_files': view_files,
+            'view_files': [model['view_file'] for model in context.get('models', [])],
             'data_files': [],
             'demo_files': [],
         })
 
         content = template.render(**context)
-        (module_dir / '__manifest__.py').write_text(content)
+        self._write(module_dir / '__manifest__.py', content)
 
     def _generate_init_files(self, module_dir: Path, models: List[Dict]):
         """Generate __init__.py files"""
         # Root __init__.py
         model_imports = ', '.join(f'models' for _ in models) if models else ''
         root_init = f"# -*- coding: utf-8 -*-\n\nfrom . import {model_imports}\n" if models else "# -*- coding: utf-8 -*-\n"
-        (module_dir / '__init__.py').write_text(root_init)
+        self._write(module_dir / '__init__.py', root_init)
 
         # Models __init__.py
         if models:
@@ -244,16 +300,17 @@ class OdooModuleGenerator:
                 for model in models
             )
             models_init = f"# -*- coding: utf-8 -*-\n\n{model_imports}\n"
-            (module_dir / 'models' / '__init__.py').write_text(models_init)
+            self._write(module_dir / 'models' / '__init__.py', models_init)
 
         # Tests __init__.py
-        (module_dir / 'tests' / '__init__.py').write_text(
+        self._write(
+            module_dir / 'tests' / '__init__.py',
             "# -*- coding: utf-8 -*-\n\nfrom . import test_common\n"
         )
 
     def _generate_models(self, module_dir: Path, context: Dict):
         """Generate model files"""
-        template = self.env.get_template('model.py.j2')
+        template = self._templates['model.py.j2']
 
         for model in context.get('models', []):
             model_context = {
@@ -265,11 +322,11 @@ class OdooModuleGenerator:
 
             content = template.render(**model_context)
             file_path = module_dir / 'models' / model['file_name']
-            file_path.write_text(content)
+            self._write(file_path, content)
 
     def _generate_views(self, module_dir: Path, context: Dict):
         """Generate view XML files"""
-        template = self.env.get_template('view.xml.j2')
+        template = self._templates['view.xml.j2']
 
         for model in context.get('models', []):
             view_context = {
@@ -280,27 +337,20 @@ class OdooModuleGenerator:
                 'tree_view': True,
                 'form_view': True,
                 'search_view': True,
-                'tree_fields': [{'name': f['name'], 'optional': False} for f in model['fields'][:5]],
+                'tree_fields': model['tree_fields'],
                 'form_fields': model['fields'],
-                'search_fields': [{'name': f['name']} for f in model['fields'][:3]],
+                'search_fields': model['search_fields'],
                 'view_modes': ['tree', 'form'],
-                'menu_items': [
-                    {
-                        'id': f"{model['model_safe']}_root",
-                        'name': model['class_name'],
-                        'action': f"action_{model['model_safe']}",
-                        'sequence': 10,
-                    }
-                ],
+                'menu_items': model['menu_items'],
             }
 
             content = template.render(**view_context)
-            file_path = module_dir / 'views' / f"{model['model_safe']}_views.xml"
-            file_path.write_text(content)
+            file_path = module_dir / model['view_file']
+            self._write(file_path, content)
 
     def _generate_security(self, module_dir: Path, context: Dict):
         """Generate security files"""
-        template = self.env.get_template('security.csv.j2')
+        template = self._templates['security.csv.j2']
 
         access_rules = []
         for model in context.get('models', []):
@@ -317,7 +367,7 @@ class OdooModuleGenerator:
             })
 
         content = template.render(access_rules=access_rules)
-        (module_dir / 'security' / 'ir.model.access.csv').write_text(content)
+        self._write(module_dir / 'security' / 'ir.model.access.csv', content)
 
     def _generate_tests(self, module_dir: Path, context: Dict):
         """Generate test files"""
@@ -337,7 +387,7 @@ class TestCommon(TransactionCase):
         # TODO: Add common test setup
         pass
 """
-        (module_dir / 'tests' / 'test_common.py').write_text(test_common)
+        self._write(module_dir / 'tests' / 'test_common.py', test_common)
 
         # Generate test file for each model
         for model in context.get('models', []):
@@ -366,7 +416,7 @@ class Test{model['class_name']}(TestCommon):
         # TODO: Add constraint tests
         pass
 """
-            (module_dir / 'tests' / f"test_{model['model_safe']}.py").write_text(test_file)
+            self._write(module_dir / 'tests' / f"test_{model['model_safe']}.py", test_file)
 
     def _generate_readme(self, module_dir: Path, context: Dict):
         """Generate README.rst"""
@@ -430,7 +480,7 @@ This module is part of the `OCA/project <https://github.com/OCA/project/tree/{co
 
 You are welcome to contribute. To learn how please visit https://odoo-community.org/page/Contribute.
 """
-        (module_dir / 'README.rst').write_text(readme)
+        self._write(module_dir / 'README.rst', readme)
 
 
 def main():
@@ -18,43 +18,135 @@ License: Apache-2.0
 """
 
 import argparse
+import functools
+import io
 import os
+import re
 import sys
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+
+# Valid --name and --models values
+MODULE_NAME_RE = re.compile(r"[a-z][a-z0-9_]*")
+MODEL_NAME_RE = re.compile(r"[a-z][a-z0-9_]*(?:\.[a-z][a-z0-9_]*)+")
+
+# Write generated files from a thread pool from this many files on
+PARALLEL_WRITE_MIN_FILES = 32
+
+# Single-pass character maps for the model name helpers
+_DOT_TO_UNDERSCORE = str.maketrans(".", "_")
+_SEPARATORS_TO_SPACE = str.maketrans("._", "  ")
+
+# Header row of security/ir.model.access.csv
+_CSV_HEADER = "id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink\n"
+
+# Most buffers a single writev() accepts (IOV_MAX on Linux and macOS)
+_IOV_MAX = 1024
+
+
+def _write_all(fd: int, buffers: List[bytes]):
+    """Write buffers to fd in order, gathered into as few syscalls as possible"""
+    views = [memoryview(buffer) for buffer in buffers if buffer]
+    if not hasattr(os, "writev"):
+        for view in views:
+            while view:
+                view = view[os.write(fd, view):]
+        return
+
+    start = 0
+    while start < len(views):
+        written = os.writev(fd, views[start:start + _IOV_MAX])
+        # Skip the buffers written in full and trim a partially written one
+        while written:
+            if written >= len(views[start]):
+                written -= len(views[start])
+                start += 1
+            else:
+                views[start] = views[start][written:]
+                written = 0
+
+
+def _same_bytes(data: bytes, buffers: List[bytes]) -> bool:
+    """Whether data equals the concatenation of buffers (sizes already match)"""
+    view = memoryview(data)
+    offset = 0
+    for buffer in buffers:
+        if view[offset:offset + len(buffer)] != buffer:
+            return False
+        offset += len(buffer)
+    return True
 
 
 class OdooModuleScaffolder:
     """OCA-compliant Odoo module generator"""
 
-    def __init__(self, name: str, category: str, models: List[str], odoo_version: str = "16.0"):
+    def __init__(self, name: str, category: str, models: List[str], odoo_version: str = "16.0",
+                 force: bool = False, tarball: Optional[str] = None):
         self.name = name
         self.category = category
         self.models = models
         self.odoo_version = odoo_version
+        self.force = force
+        # Pack the module into this .tar instead of writing it to disk
+        self.tarball = tarball
         self.module_path = Path(f"custom_addons/{name}")
+        # Generated files by path, written together by _flush_writes()
+        self._pending_writes: Dict[Path, str] = {}
 
     def scaffold(self):
         """Generate complete module structure"""
-        print(f"🏗️  Scaffolding OCA module: {self.name}")
-
-        # Create directory structure
-        self._create_directories()
-
-        # Generate files
-        self._create_manifest()
-        self._create_init_files()
-        self._create_models()
-        self._create_security()
-        self._create_tests()
-        self._create_readme()
-
-        print(f"✅ Module scaffolding complete: {self.module_path}")
+        # Progress lines are buffered and written to stdout in one go
+        self._messages = [f"🏗️  Scaffolding OCA module: {self.name}"]
+        try:
+            # Copyright year shared by every generated file
+            self._year = self._get_current_year()
+            # Names derived from each model, computed once for all generators
+            self._model_meta = [
+                {
+                    "model": model_name,
+                    "filename": self._model_to_filename(model_name),
+                    "classname": self._model_to_classname(model_name),
+                    "description": self._format_description(model_name),
+                }
+                for model_name in self.models
+            ]
+
+            # Create directory structure
+            if not self.tarball:
+                self._create_directories()
+
+            # Generate files
+            self._create_manifest()
+            self._create_init_files()
+            self._create_models()
+            self._create_security()
+            self._create_tests()
+            self._create_readme()
+            if self.tarball:
+                self._write_tarball()
+            else:
+                self._flush_writes()
+            self._log(f"✅ Module scaffolding complete: {self.tarball or self.module_path}")
+        finally:
+            sys.stdout.write("\n".join(self._messages) + "\n")
+            sys.stdout.flush()
 
     def _create_directories(self):
         """Create standard OCA directory structure"""
-        directories = [
-            self.module_path,
+        # Leaf directories only: mkdir(parents=True) creates the module
+        # directory itself on the way
+        directories = self._directories()
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+        self._log(f"📁 Created: {self.module_path}/{{{','.join(d.name for d in directories)}}}")
+
+    def _directories(self) -> List[Path]:
+        """Leaf directories of the standard OCA module layout"""
+        return [
             self.module_path / "models",
             self.module_path / "security",
             self.module_path / "tests",
@@ -62,13 +154,9 @@ class OdooModuleScaffolder:
             self.module_path / "data",
         ]
 
-        for directory in directories:
-            directory.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Created: {directory}")
-
     def _create_manifest(self):
         """Generate __manifest__.py following OCA conventions"""
-        manifest_content = f'''# Copyright {self._get_current_year()} InsightPulseAI
+        manifest_content = f'''# Copyright {self._year} InsightPulseAI
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0)
 
 {{
@@ -83,6 +171,7 @@ class OdooModuleScaffolder:
     ],
     "data": [
         "security/ir.model.access.csv",
+        "security/record_rules.xml",
         "views/{self.name}_views.xml",
     ],
     "demo": [],
@@ -92,37 +181,29 @@ class OdooModuleScaffolder:
 }}
 '''
         manifest_path = self.module_path / "__manifest__.py"
-        manifest_path.write_text(manifest_content)
-        print(f"📄 Created: {manifest_path}")
+        self._write(manifest_path, manifest_content)
 
     def _create_init_files(self):
         """Create __init__.py files for Python package structure"""
         # Root __init__.py
         root_init = self.module_path / "__init__.py"
-        root_init.write_text("from . import models\n")
-        print(f"📄 Created: {root_init}")
-
-        # models/__init__.py
-        models_init = self.module_path / "models" / "__init__.py"
-        model_imports = "\n".join([
-            f"from . import {self._model_to_filename(model)}"
-            for model in self.models
-        ])
-        models_init.write_text(model_imports + "\n")
-        print(f"📄 Created: {models_init}")
+        self._write(root_init, "from . import models\n")
+
+        # models/__init__.py is written by _create_models()
 
         # tests/__init__.py
         tests_init = self.module_path / "tests" / "__init__.py"
-        tests_init.write_text("from . import test_models\n")
-        print(f"📄 Created: {tests_init}")
+        self._write(tests_init, "from . import test_models\n")
 
     def _create_models(self):
-        """Generate model files with ORM patterns"""
-        for model_name in self.models:
-            filename = self._model_to_filename(model_name)
-            class_name = self._model_to_classname(model_name)
-
-            model_content = f'''# Copyright {self._get_current_year()} InsightPulseAI
+        """Generate model files with ORM patterns, and models/__init__.py"""
+        model_imports = []
+        for meta in self._model_meta:
+            model_name = meta["model"]
+            filename = meta["filename"]
+            class_name = meta["classname"]
+
+            model_content = f'''# Copyright {self._year} InsightPulseAI
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0)
 
 from odoo import models, fields, api
@@ -133,7 +214,7 @@ class {class_name}(models.Model):
     """Model for {model_name}"""
 
     _name = "{model_name}"
-    _description = "{self._format_description(model_name)}"
+    _description = "{meta['description']}"
     _order = "create_date desc"
 
     # Basic fields
@@ -217,46 +298,43 @@ class {class_name}(models.Model):
 '''
 
             model_path = self.module_path / "models" / f"{filename}.py"
-            model_path.write_text(model_content)
-            print(f"📄 Created: {model_path}")
+            self._write(model_path, model_content)
+            model_imports.append(f"from . import {filename}\n")
+
+        self._write(self.module_path / "models" / "__init__.py", model_imports)
 
     def _create_security(self):
         """Generate ir.model.access.csv with proper permissions"""
-        csv_rows = ["id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink"]
-
-        for model_name in self.models:
-            model_id = f"model_{model_name.replace('.', '_')}"
-            access_id = f"access_{model_name.replace('.', '_')}_user"
-            access_name = f"access_{model_name.replace('.', '_')}_user"
-
-            # User access (read, write, create, unlink)
-            csv_rows.append(
-                f"{access_id},{access_name},{model_id},base.group_user,1,1,1,1"
-            )
-
-        csv_content = "\n".join(csv_rows) + "\n"
+        # User access (read, write, create, unlink), one row per model
+        csv_content = "".join(
+            [_CSV_HEADER]
+            + [
+                f"access_{meta['filename']}_user,access_{meta['filename']}_user,"
+                f"model_{meta['filename']},base.group_user,1,1,1,1\n"
+                for meta in self._model_meta
+            ]
+        )
         csv_path = self.module_path / "security" / "ir.model.access.csv"
-        csv_path.write_text(csv_content)
-        print(f"📄 Created: {csv_path}")
+        self._write(csv_path, csv_content)
 
         # Create record rules
         self._create_record_rules()
 
     def _create_record_rules(self):
         """Generate record rules for row-level security"""
-        rules_content = f'''<?xml version="1.0" encoding="utf-8"?>
+        rules_parts = [f'''<?xml version="1.0" encoding="utf-8"?>
 <odoo>
     <data noupdate="1">
-'''
+''']
 
-        for model_name in self.models:
-            model_ref = f"model_{model_name.replace('.', '_')}"
-            rule_id = f"{model_name.replace('.', '_')}_user_rule"
+        for meta in self._model_meta:
+            model_ref = f"model_{meta['filename']}"
+            rule_id = f"{meta['filename']}_user_rule"
 
-            rules_content += f'''
+            rules_parts.append(f'''
         <!-- Users can only see their own records -->
         <record id="{rule_id}" model="ir.rule">
-            <field name="name">{self._format_description(model_name)} - User Access</field>
+            <field name="name">{meta['description']} - User Access</field>
             <field name="model_id" ref="{model_ref}"/>
             <field name="domain_force">[('user_id', '=', user.id)]</field>
             <field name="groups" eval="[(4, ref('base.group_user'))]"/>
@@ -265,29 +343,19 @@ class {class_name}(models.Model):
             <field name="perm_create" eval="True"/>
             <field name="perm_unlink" eval="True"/>
         </record>
-'''
+''')
 
-        rules_content += '''
+        rules_parts.append('''
     </data>
 </odoo>
-'''
+''')
 
         rules_path = self.module_path / "security" / "record_rules.xml"
-        rules_path.write_text(rules_content)
-
-        # Update manifest to include record rules
-        manifest_path = self.module_path / "__manifest__.py"
-        manifest_content = manifest_path.read_text()
-        manifest_content = manifest_content.replace(
-            '"security/ir.model.access.csv",',
-            '"security/ir.model.access.csv",\n        "security/record_rules.xml",'
-        )
-        manifest_path.write_text(manifest_content)
-        print(f"📄 Created: {rules_path}")
+        self._write(rules_path, rules_parts)
 
     def _create_tests(self):
         """Generate pytest-odoo test templates"""
-        test_content = f'''# Copyright {self._get_current_year()} InsightPulseAI
+        test_parts = [f'''# Copyright {self._year} InsightPulseAI
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0)
 
 from odoo.tests.common import TransactionCase
@@ -300,29 +368,30 @@ class TestModels(TransactionCase):
     def setUp(self):
         super().setUp()
         self.user = self.env.ref("base.user_demo")
-'''
+''']
 
-        for model_name in self.models:
-            class_var = self._model_to_classname(model_name) + "Model"
-            test_content += f'''
-        self.{class_var} = self.env["{model_name}"]
-'''
+        for meta in self._model_meta:
+            test_parts.append(f'''
+        self.{meta['classname']}Model = self.env["{meta['model']}"]
+''')
 
         # Add test methods
-        for model_name in self.models:
-            class_var = self._model_to_classname(model_name) + "Model"
-            safe_name = model_name.replace(".", "_")
+        for meta in self._model_meta:
+            model_name = meta["model"]
+            class_var = meta["classname"] + "Model"
+            safe_name = meta["filename"]
+            description = meta["description"]
 
-            test_content += f'''
+            test_parts.append(f'''
 
     def test_create_{safe_name}(self):
         """Test creating {model_name} record"""
         record = self.{class_var}.create({{
-            "name": "Test {self._format_description(model_name)}",
+            "name": "Test {description}",
             "user_id": self.user.id,
         }})
         self.assertTrue(record)
-        self.assertEqual(record.name, "Test {self._format_description(model_name)}")
+        self.assertEqual(record.name, "Test {description}")
         self.assertEqual(record.state, "draft")
 
     def test_{safe_name}_workflow(self):
@@ -360,11 +429,10 @@ class TestModels(TransactionCase):
         }})
         self.assertIn("Test Compute", record.display_name_custom)
         self.assertIn("[Draft]", record.display_name_custom)
-'''
+''')
 
         test_path = self.module_path / "tests" / "test_models.py"
-        test_path.write_text(test_content)
-        print(f"📄 Created: {test_path}")
+        self._write(test_path, test_parts)
 
     def _create_readme(self):
         """Generate OCA-compliant README.rst"""
@@ -435,8 +503,86 @@ This module is part of the odoo-expertise project.
 '''
 
         readme_path = self.module_path / "README.rst"
-        readme_path.write_text(readme_content)
-        print(f"📄 Created: {readme_path}")
+        self._write(readme_path, readme_content)
+
+    def _log(self, message: str):
+        """Buffer a progress line, printed at the end of scaffold()"""
+        self._messages.append(message)
+
+    def _write(self, path: Path, content: Union[str, List[str]]):
+        """Queue a generated file, written by _flush_writes()
+
+        content may also be the list of consecutive parts of the file, which
+        are then written without being joined into one string first.
+        """
+        self._pending_writes[path] = content
+
+    def _flush_writes(self):
+        """Write all queued files in one pass with raw os.open/os.write
+
+        Modules with many models are written from a thread pool so the
+        open/write/close latency of the files overlaps (os calls release
+        the GIL); a handful of files is faster to write inline.
+        """
+        pending, self._pending_writes = self._pending_writes, {}
+        write = functools.partial(self._write_file, force=self.force)
+        if len(pending) >= PARALLEL_WRITE_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                written = list(executor.map(write, pending, pending.values()))
+        else:
+            written = [write(path, content) for path, content in pending.items()]
+
+        for path, changed in zip(pending, written):
+            self._log(f"📄 {'Created' if changed else 'Unchanged'}: {path}")
+
+    def _write_tarball(self):
+        """Pack all queued files into an uncompressed tar in one sequential write
+
+        Members are stored relative to the addons directory, so extracting
+        the archive there recreates the module (empty directories included).
+        """
+        pending, self._pending_writes = self._pending_writes, {}
+        root = self.module_path.parent
+        mtime = int(time.time())
+        with tarfile.open(self.tarball, "w") as tar:
+            for directory in self._directories():
+                info = tarfile.TarInfo(directory.relative_to(root).as_posix())
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                info.mtime = mtime
+                tar.addfile(info)
+            for path, content in pending.items():
+                data = "".join(content).encode("utf-8")
+                info = tarfile.TarInfo(path.relative_to(root).as_posix())
+                info.size = len(data)
+                info.mode = 0o644
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+        self._log(f"📦 Packed {len(pending)} files into {self.tarball}")
+
+    @staticmethod
+    def _write_file(path: Path, content: Union[str, List[str]], force: bool = False) -> bool:
+        """Write content to path as UTF-8 without a buffered text wrapper
+
+        Unless force is set, a file that already holds exactly this content
+        is left alone. Returns whether the file was written.
+        """
+        parts = [content] if isinstance(content, str) else content
+        buffers = [part.encode("utf-8") for part in parts]
+        if not force:
+            try:
+                if (os.stat(path).st_size == sum(map(len, buffers))
+                        and _same_bytes(path.read_bytes(), buffers)):
+                    return False
+            except FileNotFoundError:
+                pass
+
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            _write_all(fd, buffers)
+        finally:
+            os.close(fd)
+        return True
 
     def _create_views(self):
         """Generate basic view XML (optional)"""
@@ -446,7 +592,7 @@ This module is part of the odoo-expertise project.
     # Helper methods
     def _model_to_filename(self, model_name: str) -> str:
         """Convert model name to filename (expense.approval -> expense_approval)"""
-        return model_name.replace(".", "_")
+        return model_name.translate(_DOT_TO_UNDERSCORE)
 
     def _model_to_classname(self, model_name: str) -> str:
         """Convert model name to class name (expense.approval -> ExpenseApproval)"""
@@ -459,11 +605,10 @@ This module is part of the odoo-expertise project.
 
     def _format_description(self, text: str) -> str:
         """Format description text"""
-        return text.replace(".", " ").replace("_", " ").title()
+        return text.translate(_SEPARATORS_TO_SPACE).title()
 
     def _get_current_year(self) -> int:
         """Get current year for copyright"""
-        from datetime import datetime
         return datetime.now().year
 
 
@@ -483,6 +628,9 @@ Examples:
 
   # Custom Odoo version
   python scaffold_module.py --name my_module --category Custom --models my.model --version 17.0
+
+  # Pack the module into a tarball for later deployment
+  python scaffold_module.py --name my_module --category Custom --models my.model --tarball my_module.tar
         """
     )
 
@@ -506,9 +654,24 @@ Examples:
         default="16.0",
         help="Odoo version (default: 16.0)"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite files even when their content is unchanged"
+    )
+    parser.add_argument(
+        "--tarball",
+        metavar="PATH",
+        help="Write the module into this uncompressed .tar instead of custom_addons/"
+    )
 
     args = parser.parse_args()
 
+    # The names end up in generated Python and XML, so only accept identifiers
+    if not MODULE_NAME_RE.fullmatch(args.name):
+        print(f"❌ Error: Module name must be lowercase letters, digits and underscores: {args.name}")
+        sys.exit(1)
+
     # Parse models
     models = [m.strip() for m in args.models.split(",") if m.strip()]
 
@@ -518,8 +681,9 @@ Examples:
 
     # Validate model names
     for model in models:
-        if "." not in model:
-            print(f"❌ Error: Model name must contain '.' (e.g., 'expense.approval'): {model}")
+        if not MODEL_NAME_RE.fullmatch(model):
+            print(f"❌ Error: Model name must be dot-separated lowercase identifiers "
+                  f"(e.g., 'expense.approval'): {model}")
             sys.exit(1)
 
     # Generate module
@@ -527,13 +691,15 @@ Examples:
         name=args.name,
         category=args.category,
         models=models,
-        odoo_version=args.version
+        odoo_version=args.version,
+        force=args.force,
+        tarball=args.tarball
     )
 
     try:
         scaffolder.scaffold()
         print("\n✅ SUCCESS: Module scaffolding complete!")
-        print(f"\n📂 Module location: {scaffolder.module_path}")
+        print(f"\n📂 Module location: {args.tarball or scaffolder.module_path}")
         print("\n📋 Next steps:")
         print("   1. Review generated files")
         print("   2. Customize model fields and logic")